@@ -0,0 +1,55 @@
+"""
+Compare ``QuerySet.exists()`` with ``bool(queryset)``, which fetches and
+builds a whole document, on large documents.
+
+Needs a running MongoDB (see ``MONGODB_DATABASES`` in tests/settings.py)::
+
+    python benchmarks/bench_exists.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django_mongoengine import Document, fields  # noqa: E402
+
+DOCUMENTS = 1000
+PAYLOAD_SIZE = 256 * 1024
+NUMBER = 500
+
+
+class LargeDocument(Document):
+    index = fields.IntField()
+    payload = fields.ListField(fields.StringField())
+
+    meta = {"collection": "bench_exists", "app_label": "benchmarks"}
+
+
+def main():
+    LargeDocument.drop_collection()
+    payload = ["x" * 1024] * (PAYLOAD_SIZE // 1024)
+    LargeDocument.objects.insert(
+        [LargeDocument(index=i, payload=payload) for i in range(DOCUMENTS)], load_bulk=False
+    )
+
+    queryset = LargeDocument.objects.filter(index__gte=DOCUMENTS // 2)
+    for name, stmt in [
+        ("bool(queryset)", lambda: bool(queryset.clone())),
+        ("queryset.exists()", lambda: queryset.clone().exists()),
+        ("no_cache().exists()", lambda: queryset.no_cache().exists()),
+    ]:
+        seconds = timeit.timeit(stmt, number=NUMBER)
+        sys.stdout.write("%-22s %8.3f ms/call\n" % (name, seconds / NUMBER * 1000))
+
+    LargeDocument.drop_collection()
+
+
+if __name__ == "__main__":
+    main()
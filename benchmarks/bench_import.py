@@ -0,0 +1,59 @@
+"""
+Measure the import time of the generic views (``django_mongoengine.views.list``
+and ``.edit``, which patch django's generic view classes) and of
+``django_mongoengine.mongo_admin`` in fresh interpreters, with
+``python -X importtime``. Worker boot time is dominated by such imports.
+``django_mongoengine.views`` itself only resolves its exports when accessed.
+
+Doesn't need a running MongoDB::
+
+    python benchmarks/bench_import.py
+"""
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+MODULES = [
+    "django_mongoengine.views.list",
+    "django_mongoengine.views.edit",
+    "django_mongoengine.mongo_admin",
+]
+RUNS = 5
+
+SETUP = "import django; django.setup(); "
+
+
+def import_time(module):
+    """
+    Returns the cumulative import time of ``module``, in microseconds.
+    """
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE="tests.settings", PYTHONPATH=ROOT)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", SETUP + "import " + module],
+        env=env,
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            total = int(cumulative)
+    return total
+
+
+def main():
+    for module in MODULES:
+        times = sorted(import_time(module) for _ in range(RUNS))
+        sys.stdout.write("%-32s %8.1f ms (best of %d)\n" % (module, times[0] / 1000, RUNS))
+
+
+if __name__ == "__main__":
+    main()
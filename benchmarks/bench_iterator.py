@@ -0,0 +1,66 @@
+"""
+Peak RSS of iterating over many documents with the caching queryset and
+with ``QuerySet.iterator()``. Each mode runs in its own process.
+
+Needs a running MongoDB (see ``MONGODB_DATABASES`` in tests/settings.py)::
+
+    python benchmarks/bench_iterator.py [documents]
+"""
+
+import os
+import resource
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django_mongoengine import Document, fields  # noqa: E402
+
+DOCUMENTS = 1_000_000
+BATCH = 10_000
+
+
+class StreamedDocument(Document):
+    index = fields.IntField()
+    name = fields.StringField()
+
+    meta = {"collection": "bench_iterator", "app_label": "benchmarks"}
+
+
+def populate(documents):
+    StreamedDocument.drop_collection()
+    collection = StreamedDocument._get_collection()
+    for start in range(0, documents, BATCH):
+        stop = min(start + BATCH, documents)
+        collection.insert_many(
+            [{"index": i, "name": "document %s" % i} for i in range(start, stop)]
+        )
+
+
+def run(mode):
+    queryset = StreamedDocument.objects.all()
+    if mode == "iterator":
+        queryset = queryset.iterator(chunk_size=2000)
+    count = sum(1 for _ in queryset)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    sys.stdout.write("%-10s %9d documents, peak RSS %8.1f MiB\n" % (mode, count, peak))
+
+
+def main():
+    documents = int(sys.argv[1]) if len(sys.argv) > 1 else DOCUMENTS
+    populate(documents)
+    for mode in ("queryset", "iterator"):
+        subprocess.run([sys.executable, __file__, "--run", mode], check=True)
+    StreamedDocument.drop_collection()
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--run"]:
+        run(sys.argv[2])
+    else:
+        main()
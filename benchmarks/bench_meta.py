@@ -0,0 +1,61 @@
+"""
+Measure attribute lookups on a document's ``_meta`` (``DocumentMetaWrapper``),
+which admin pages and generic views run for every field and row, next to
+the computations they used to run on each access.
+
+Doesn't need a running MongoDB::
+
+    python benchmarks/bench_meta.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from tests.views.models import Author  # noqa: E402
+
+NUMBER = 200000
+
+
+def computed_app_label(opts):
+    if "app_label" in opts._meta:
+        return opts._meta["app_label"]
+    return sys.modules[opts.document.__module__].__name__.split(".")[-2]
+
+
+def computed_label_lower(opts):
+    return "%s.%s" % (computed_app_label(opts), opts.model_name)
+
+
+def dir_pk_lookup(pk, attr):
+    if attr in dir(pk.obj):
+        return getattr(pk.obj, attr)
+    raise AttributeError(attr)
+
+
+def main():
+    opts = Author._meta
+    pk = opts.pk
+
+    for name, stmt in [
+        ("computed app_label", lambda: computed_app_label(opts)),
+        ("_meta.app_label", lambda: opts.app_label),
+        ("computed label_lower", lambda: computed_label_lower(opts)),
+        ("_meta.label_lower", lambda: opts.label_lower),
+        ("_meta.ordering", lambda: opts.ordering),
+        ("dir() pk.db_field", lambda: dir_pk_lookup(pk, "db_field")),
+        ("_meta.pk.db_field", lambda: pk.db_field),
+    ]:
+        seconds = timeit.timeit(stmt, number=NUMBER)
+        sys.stdout.write("%-22s %8.1f ns/access\n" % (name, seconds / NUMBER * 1e9))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Compare the per-request cost of ``SessionStore.exists()`` and ``load()``
+with the queryset lookups they used to run, which fetch and build the
+whole ``MongoSession`` document.
+
+Needs a running MongoDB (see ``MONGODB_DATABASES`` in tests/settings.py)::
+
+    python benchmarks/bench_sessions.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.utils import timezone  # noqa: E402
+from django.utils.encoding import force_str  # noqa: E402
+
+from django_mongoengine.sessions import MongoSession, SessionStore  # noqa: E402
+
+SESSIONS = 1000
+NUMBER = 2000
+
+
+def queryset_exists(session_key):
+    return bool(MongoSession.objects(session_key=session_key).first())
+
+
+def queryset_load(store):
+    s = MongoSession.objects(session_key=store.session_key, expire_date__gt=timezone.now)[0]
+    return store.decode(force_str(s.session_data))
+
+
+def main():
+    MongoSession.drop_collection()
+    keys = []
+    for i in range(SESSIONS):
+        store = SessionStore()
+        store.update({"_auth_user_id": str(i), "cart": list(range(50)), "flash": "x" * 512})
+        store.save()
+        keys.append(store.session_key)
+    key = keys[SESSIONS // 2]
+    store = SessionStore(key)
+
+    for name, stmt in [
+        ("queryset exists", lambda: queryset_exists(key)),
+        ("SessionStore.exists()", lambda: store.exists(key)),
+        ("queryset load", lambda: queryset_load(store)),
+        ("SessionStore.load()", lambda: store.load()),
+    ]:
+        seconds = timeit.timeit(stmt, number=NUMBER)
+        sys.stdout.write("%-22s %8.3f ms/call\n" % (name, seconds / NUMBER * 1000))
+
+    MongoSession.drop_collection()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,10 @@
-from .document import Document, DynamicDocument, DynamicEmbeddedDocument, EmbeddedDocument
-from .queryset import QuerySet, QuerySetNoCache
+from typing import TYPE_CHECKING
+
+from .utils.lazy import lazy_module_attrs
+
+if TYPE_CHECKING:
+    from .document import Document, DynamicDocument, DynamicEmbeddedDocument, EmbeddedDocument
+    from .queryset import QuerySet, QuerySetNoCache
 
 __all__ = [
     "QuerySet",
@@ -10,6 +15,19 @@ __all__ = [
     "DynamicEmbeddedDocument",
 ]
 
+# Imported on first access, so that loading the app (or any submodule)
+# doesn't import documents, fields and forms.
+_LAZY_IMPORTS = {
+    "QuerySet": ".queryset",
+    "QuerySetNoCache": ".queryset",
+    "Document": ".document",
+    "DynamicDocument": ".document",
+    "EmbeddedDocument": ".document",
+    "DynamicEmbeddedDocument": ".document",
+}
+
+__getattr__, __dir__ = lazy_module_attrs(__name__, _LAZY_IMPORTS)
+
 try:
     from django import VERSION as _django_version
 
@@ -3,6 +3,8 @@ from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 from mongoengine import connection
 
+from .connection import register_fork_handler, validate_connection_settings, warmup
+
 
 class DjangoMongoEngineConfig(AppConfig):
     """Simple AppConfig which does not do automatic discovery."""
@@ -15,4 +17,20 @@ class DjangoMongoEngineConfig(AppConfig):
             raise ImproperlyConfigured("Missing `MONGODB_DATABASES` in settings.py")
 
         for alias, conn_settings in settings.MONGODB_DATABASES.items():
+            validate_connection_settings(alias, conn_settings)
             connection.register_connection(alias, **conn_settings)
+
+        if getattr(settings, "MONGODB_RESET_AFTER_FORK", True):
+            register_fork_handler(settings.MONGODB_DATABASES)
+
+        if getattr(settings, "MONGODB_WARMUP", False):
+            warmup(
+                settings.MONGODB_DATABASES,
+                timeout=getattr(settings, "MONGODB_WARMUP_TIMEOUT", None),
+                indexes=getattr(settings, "MONGODB_ENSURE_INDEXES", False),
+            )
+
+        if getattr(settings, "MONGOENGINE_USER_CACHE_TIMEOUT", None):
+            from .mongo_auth.backends import connect_user_cache_signals
+
+            connect_user_cache_signals()
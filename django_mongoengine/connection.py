@@ -0,0 +1,142 @@
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from django.core.exceptions import ImproperlyConfigured
+from mongoengine import connection
+from mongoengine.base.common import _document_registry, _get_documents_by_db
+from mongoengine.document import Document
+
+logger = logging.getLogger("django_mongoengine")
+
+# Pool and timeout options of pymongo.MongoClient, which accepts them in any case.
+POOL_SIZE_OPTIONS = ("maxpoolsize", "minpoolsize", "maxconnecting")
+TIMEOUT_OPTIONS = (
+    "connecttimeoutms",
+    "sockettimeoutms",
+    "serverselectiontimeoutms",
+    "waitqueuetimeoutms",
+    "maxidletimems",
+    "timeoutms",
+)
+
+
+_fork_handler_databases = None
+
+
+def _is_number(value, types):
+    # bool is a subclass of int, but True isn't a pool size.
+    return isinstance(value, types) and not isinstance(value, bool)
+
+
+def validate_connection_settings(alias, conn_settings):
+    """
+    Checks the pool size and timeout options of a ``MONGODB_DATABASES``
+    entry, so mistakes fail at startup instead of on the first query.
+    Options set to None are left to pymongo's defaults.
+    """
+    options = {key.lower(): value for key, value in conn_settings.items()}
+    for option in POOL_SIZE_OPTIONS:
+        value = options.get(option)
+        if value is not None and (not _is_number(value, int) or value < 0):
+            raise ImproperlyConfigured(
+                "MONGODB_DATABASES[%r]: %s must be a non-negative integer" % (alias, option)
+            )
+    for option in TIMEOUT_OPTIONS:
+        value = options.get(option)
+        if value is not None and (not _is_number(value, (int, float)) or value < 0):
+            raise ImproperlyConfigured(
+                "MONGODB_DATABASES[%r]: %s must be a non-negative number" % (alias, option)
+            )
+    max_pool_size = options.get("maxpoolsize")
+    if max_pool_size and (options.get("minpoolsize") or 0) > max_pool_size:
+        raise ImproperlyConfigured(
+            "MONGODB_DATABASES[%r]: minPoolSize can't be greater than maxPoolSize" % alias
+        )
+
+
+def warmup_connection(alias, conn_settings):
+    """
+    Connects ``alias`` and runs server selection and the handshake. Then,
+    if the alias sets ``minPoolSize``, opens that many pool connections
+    with concurrent pings.
+    """
+    client = connection.get_connection(alias)
+    client.admin.command("ping")
+    options = {key.lower(): value for key, value in conn_settings.items()}
+    min_pool_size = options.get("minpoolsize") or 0
+    if min_pool_size > 1:
+        with ThreadPoolExecutor(min_pool_size) as executor:
+            for _ in range(min_pool_size):
+                executor.submit(client.admin.command, "ping")
+
+
+def ensure_indexes():
+    """
+    Creates the indexes of every registered top level document.
+    """
+    for document in list(_document_registry.values()):
+        meta = document._meta
+        if meta.get("abstract") or not hasattr(document, "ensure_indexes"):
+            continue
+        document.ensure_indexes()
+
+
+def warmup(databases, timeout=None, indexes=False):
+    """
+    Connects all ``databases`` aliases concurrently, waiting at most
+    ``timeout`` seconds, then optionally creates the indexes of registered
+    documents. Connection failures are logged, not raised.
+    """
+    if not databases:
+        return
+    executor = ThreadPoolExecutor(len(databases), thread_name_prefix="mongodb-warmup")
+    futures = {
+        executor.submit(warmup_connection, alias, conn_settings): alias
+        for alias, conn_settings in databases.items()
+    }
+    done, not_done = wait(futures, timeout=timeout)
+    executor.shutdown(wait=False)
+    for future in not_done:
+        logger.warning("MongoDB warmup of %r did not finish in %ss", futures[future], timeout)
+    failed = False
+    for future in done:
+        if future.exception() is not None:
+            failed = True
+            logger.warning(
+                "MongoDB warmup of %r failed", futures[future], exc_info=future.exception()
+            )
+    if indexes and not failed and not not_done:
+        ensure_indexes()
+
+
+def reset_connections(aliases):
+    """
+    Forgets the clients of ``aliases`` so they are created again on first
+    use. The clients are not closed: in a forked child their sockets are
+    still shared with the parent process.
+    """
+    for alias in aliases:
+        connection._connections.pop(alias, None)
+        if connection._dbs.pop(alias, None) is not None:
+            for document in _get_documents_by_db(alias, connection.DEFAULT_CONNECTION_NAME):
+                if issubclass(document, Document):
+                    document._disconnect()
+
+
+def _reset_connections_after_fork():
+    reset_connections(_fork_handler_databases)
+
+
+def register_fork_handler(databases):
+    """
+    Resets the connections of ``databases`` aliases in forked children, so
+    prefork servers can connect in the master process and still get a pool
+    per worker.
+    """
+    global _fork_handler_databases
+    if not hasattr(os, "register_at_fork"):
+        return
+    if _fork_handler_databases is None:
+        os.register_at_fork(after_in_child=_reset_connections_after_fork)
+    _fork_handler_databases = list(databases)
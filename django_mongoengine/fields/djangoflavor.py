@@ -6,8 +6,6 @@ from django.utils.functional import cached_property
 from django.utils.text import capfirst
 from mongoengine import fields
 
-from django_mongoengine.forms import fields as formfields
-
 from .internal import INTERNAL_DJANGO_FIELDS_MAP
 
 # Add some default values, required for django.
@@ -249,6 +247,8 @@ class DateTimeField(DjangoField):
 
 class ReferenceField(DjangoField):
     def formfield(self, **kwargs):
+        from django_mongoengine.forms import fields as formfields
+
         defaults = {
             "form_class": formfields.ReferenceField,
             "queryset": self.document_type.objects,
@@ -260,6 +260,8 @@ class ReferenceField(DjangoField):
 # TODO: test field.field.choices?
 class ListField(DjangoField):
     def formfield(self, **kwargs):
+        from django_mongoengine.forms import fields as formfields
+
         if self.field.choices:
             defaults = {
                 "choices": self.field.choices,
@@ -305,6 +307,8 @@ class ImageField(FileField):
 
 class DictField(DjangoField):
     def formfield(self, **kwargs):
+        from django_mongoengine.forms import fields as formfields
+
         # remove Mongo reserved words
         validators = [
             RegexValidator(
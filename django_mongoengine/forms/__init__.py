@@ -1,2 +1,48 @@
-from .documents import *  # noqa: F403
-from .utils import *  # noqa: F403
+from typing import TYPE_CHECKING
+
+from django_mongoengine.utils.lazy import lazy_module_attrs
+
+if TYPE_CHECKING:
+    from .documents import *  # noqa: F403
+    from .utils import *  # noqa: F403
+
+# The public names of .documents and .utils, which used to be star-imported.
+# They are imported on first access, so that forms.document_options can be
+# used without the form machinery.
+_LAZY_IMPORTS = {
+    **dict.fromkeys(
+        [
+            "ALL_FIELDS",
+            "BaseDocumentForm",
+            "BaseDocumentFormSet",
+            "BaseInlineDocumentFormSet",
+            "DeclarativeFieldsMetaclass",
+            "DocumentForm",
+            "DocumentFormMetaclass",
+            "DocumentFormOptions",
+            "EmbeddedDocumentForm",
+            "EmbeddedDocumentFormSet",
+            "FieldError",
+            "FileField",
+            "ImproperlyConfigured",
+            "ObjectIdField",
+            "ValidationError",
+            "construct_instance",
+            "documentform_factory",
+            "documentformset_factory",
+            "embeddedformset_factory",
+            "inlineformset_factory",
+            "model_forms",
+            "save_instance",
+        ],
+        ".documents",
+    ),
+    **dict.fromkeys(
+        ["Field", "OrderedDict", "get_declared_fields", "partial", "patch_document"],
+        ".utils",
+    ),
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+__getattr__, __dir__ = lazy_module_attrs(__name__, _LAZY_IMPORTS)
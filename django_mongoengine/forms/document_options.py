@@ -1,16 +1,14 @@
-import sys
-
 from django.core.exceptions import FieldDoesNotExist
 from django.db.models.options import Options
 from django.utils.encoding import smart_str
-from django.utils.text import capfirst
+from django.utils.text import capfirst, format_lazy
 
 try:
     from django.db.models.options import get_verbose_name as camel_case_to_spaces
 except ImportError:
-    from django.utils.text import camel_case_to_spaces, format_lazy
+    from django.utils.text import camel_case_to_spaces
 
-from mongoengine.fields import ReferenceField
+from mongoengine.fields import EmbeddedDocumentField, ListField
 
 
 class PkWrapper:
@@ -21,9 +19,12 @@ class PkWrapper:
 
     def __init__(self, wrapped):
         self.obj = wrapped
+        # dir() is slow; attributes set on the field later are found in
+        # its __dict__.
+        super().__setattr__("_dir", frozenset(dir(wrapped)))
 
     def __getattr__(self, attr):
-        if attr in dir(self.obj):
+        if attr in self._dir or attr in self.obj.__dict__:
             return getattr(self.obj, attr)
         raise AttributeError(f"{self} has no {attr}")
 
@@ -54,6 +55,10 @@ class DocumentMetaWrapper:
     object_name = None
     model_name = None
     verbose_name = None
+    verbose_name_plural = None
+    app_label = None
+    label = None
+    label_lower = None
     has_auto_field = False
     abstract = False
     object_name = None
@@ -102,6 +107,19 @@ class DocumentMetaWrapper:
             self.object_name = self.document.__class__.__name__
 
         self.verbose_name = self.get_verbose_name()
+        if "verbose_name_plural" in self._meta:
+            self.verbose_name_plural = self._meta["verbose_name_plural"]
+        else:
+            self.verbose_name_plural = format_lazy("{}s", self.verbose_name)
+
+        # Looked up for every field and row of admin pages; compute once.
+        if "app_label" in self._meta:
+            self.app_label = self._meta["app_label"]
+        else:
+            # "<app_label>.models", or the module itself if it isn't in a package.
+            package = document.__module__.rpartition(".")[0]
+            self.app_label = package.rpartition(".")[2] or document.__module__
+        self.label = self.label_lower = "%s.%s" % (self.app_label, self.model_name)
 
         # EmbeddedDocuments don't have an id field.
         try:
@@ -110,22 +128,6 @@ class DocumentMetaWrapper:
         except KeyError:
             pass
 
-    @property
-    def label(self):
-        return "%s.%s" % (self.app_label, self.model_name)
-
-    @property
-    def label_lower(self):
-        return "%s.%s" % (self.app_label, self.model_name)
-
-    @property
-    def app_label(self) -> str:
-        if "app_label" in self._meta:
-            return self._meta["app_label"]
-        else:
-            model_module = sys.modules[self.document.__module__]
-            return model_module.__name__.split(".")[-2]
-
     def get_path_to_parent(self, parent):
         # This is just placeholders.
         # If you depend on this, port it from django.
@@ -150,13 +152,6 @@ class DocumentMetaWrapper:
     def verbose_name_raw(self):
         return str(self.verbose_name)
 
-    @property
-    def verbose_name_plural(self):
-        if "verbose_name_plural" in self._meta:
-            return self.meta["verbose_name_plural"]
-        else:
-            return format_lazy("{}s", self.verbose_name)
-
     @property
     def pk(self):
         if not hasattr(self._pk, "attname"):
@@ -164,8 +159,19 @@ class DocumentMetaWrapper:
         return self._pk
 
     def get_fields(self, include_parents=True, include_hidden=False):
-        # XXX: simple placeholder; TODO: handle options;
-        return self.concrete_fields
+        """
+        Returns the fields of the document. ``include_parents=False`` leaves
+        out the fields inherited from concrete parent documents. Documents
+        have no hidden (reverse) fields, so ``include_hidden`` changes nothing.
+        """
+        if include_parents:
+            return tuple(self.concrete_fields)
+        inherited = set()
+        for base in self.document.__bases__:
+            meta = getattr(base, "_meta", None)
+            if isinstance(meta, DocumentMetaWrapper) and not meta.get("abstract"):
+                inherited.update(base._fields)
+        return tuple(f for name, f in self.document._fields.items() if name not in inherited)
 
     def _init_pk(self):
         """
@@ -207,28 +213,20 @@ class DocumentMetaWrapper:
         for this field (since the field doesn't have an instance associated
         with it).
 
-        Uses a cache internally, so after the first access, this is very fast.
+        Fields are found by name, by ``db_field`` and, for fields of embedded
+        documents, by ``a__b`` paths. The index is built on first access.
         """
+        if self._field_cache is None:
+            self._init_field_cache()
         try:
-            try:
-                return self._field_cache[name]
-            except TypeError:
-                self._init_field_cache()
-                return self._field_cache[name]
+            return self._field_cache[name]
         except KeyError:
             raise FieldDoesNotExist("%s has no field named %r" % (self.object_name, name))
 
     def _init_field_cache(self):
-        if self._field_cache is None:
-            self._field_cache = {}
-
-        for f in self.document._fields.values():
-            if isinstance(f, ReferenceField):
-                document = f.document_type
-                self._field_cache[document._meta.model_name] = (f, document, False, False)
-            else:
-                self._field_cache[f.name] = (f, None, True, False)
-
+        # Not built in __init__: embedded document types may not be
+        # defined yet when the document class is created.
+        self._field_cache = _index_fields(self.document, set())
         return self._field_cache
 
     def get_field(self, name, many_to_many=True):
@@ -275,3 +273,25 @@ class DocumentMetaWrapper:
 
     def items(self):
         return self._meta.items()
+
+
+def _index_fields(document, seen):
+    """
+    Returns a ``{name: (field, None, True, False)}`` index of the fields of
+    ``document``, by name and ``db_field``, including ``a__b`` paths into
+    embedded documents. ``seen`` holds the documents being indexed, to stop
+    at recursive embedded documents.
+    """
+    seen = seen | {document}
+    index = {}
+    for f in document._fields.values():
+        entry = (f, None, True, False)
+        index.setdefault(f.db_field, entry)
+        index[f.name] = entry
+        embedded = f.field if isinstance(f, ListField) else f
+        if isinstance(embedded, EmbeddedDocumentField):
+            document_type = embedded.document_type
+            if document_type not in seen:
+                for path, sub_entry in _index_fields(document_type, seen).items():
+                    index.setdefault("%s__%s" % (f.name, path), sub_entry)
+    return index
@@ -5,6 +5,7 @@ from django import forms
 from django.apps import apps
 from django.conf import settings
 from django.contrib.admin import helpers, widgets
+from django.contrib.admin import options as djmod
 from django.contrib.admin.exceptions import DisallowedModelAdminToField
 from django.contrib.admin.options import (
     IS_POPUP_VAR,
@@ -41,7 +42,7 @@ from django_mongoengine.forms.documents import (
 )
 from django_mongoengine.mongo_admin.util import RelationWrapper
 from django_mongoengine.paginator import Paginator
-from django_mongoengine.utils.monkey import get_patched_django_module
+from django_mongoengine.utils.monkey import get_patched_django_class
 from django_mongoengine.utils.wrappers import copy_class
 
 
@@ -49,13 +50,13 @@ def get_content_type_for_model(obj):
     return apps.get_model("contenttypes.ContentType")()
 
 
-djmod = get_patched_django_module(
-    "django.contrib.admin.options",
+ModelAdmin = get_patched_django_class(
+    djmod.ModelAdmin,
     get_content_type_for_model=get_content_type_for_model,
 )
 
 
-class BaseDocumentAdmin(djmod.ModelAdmin):
+class BaseDocumentAdmin(ModelAdmin):
     """Functionality common to both ModelAdmin and InlineAdmin."""
 
     form = DocumentForm
@@ -160,11 +161,16 @@ class BaseDocumentAdmin(djmod.ModelAdmin):
             return reverse("admin:view_on_site", kwargs={"content_type_id": 0, "object_id": obj.pk})
 
 
-@copy_class(djmod.ModelAdmin)
+@copy_class(ModelAdmin)
 class DocumentAdmin(BaseDocumentAdmin):
     "Encapsulates all admin options and functionality for a given model."
 
     paginator = Paginator
+    # Shows capped counts and KeysetPaginator links, else the stock pagination.
+    change_list_template = "mongo_admin/change_list.html"
+    # Count filtered and total changelist results with one $facet aggregation
+    # instead of two count queries.
+    facet_result_counts = False
 
     def __init__(self, model, admin_site):
         self.model = model
@@ -1,47 +1,137 @@
 from django.contrib.admin.options import IncorrectLookupParameters
-from django.contrib.admin.views.main import ORDER_VAR, ChangeList
-from django.core.exceptions import ImproperlyConfigured, SuspiciousOperation
+from django.contrib.admin.views.main import ORDER_VAR, PAGE_VAR, ChangeList
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured, SuspiciousOperation
 from django.core.paginator import InvalidPage
 
+from django_mongoengine.paginator import KeysetPaginator
+from django_mongoengine.queryset import reference_fields, referenced_document
+from django_mongoengine.router import router
+
+# Query string parameter holding the KeysetPaginator cursor.
+CURSOR_VAR = "cursor"
+
 
 class DocumentChangeList(ChangeList):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.pk_attname = self.lookup_opts.pk_name
 
+    def get_query_string(self, new_params=None, remove=None):
+        # Sorting and filtering links start over from the first page.
+        if not new_params or CURSOR_VAR not in new_params:
+            remove = [*(remove or []), CURSOR_VAR]
+        return super().get_query_string(new_params, remove)
+
+    def get_filters_params(self, params=None):
+        lookup_params = super().get_filters_params(params)
+        lookup_params.pop(CURSOR_VAR, None)
+        return lookup_params
+
     def get_results(self, request):
         paginator = self.model_admin.get_paginator(request, self.queryset, self.list_per_page)
+        show_full_result_count = self.model_admin.show_full_result_count
+        filtered = (
+            self.queryset._query != self.root_queryset._query
+            or self.queryset._where_clause != self.root_queryset._where_clause
+        )
+
+        # $where clauses can't be used in an aggregation, and paginators that
+        # cap, estimate or cache their count must compute it themselves.
+        facet = (
+            show_full_result_count
+            and filtered
+            and self.model_admin.facet_result_counts
+            and not self.queryset._where_clause
+            and not getattr(paginator, "max_count", None)
+            and not getattr(paginator, "estimate_count", False)
+            and getattr(paginator, "count_cache", None) is None
+        )
+        if facet:
+            # Count both querysets in a single aggregation.
+            paginator.count, full_result_count = self.get_facet_counts()
         # Get the number of objects, with admin filters applied.
         result_count = paginator.count
 
         # Get the total number of objects, with no admin filters applied.
-        # Perform a slight optimization: Check to see whether any filters were
-        # given. If not, use paginator.hits to calculate the number of objects,
-        # because we've already done paginator.hits and the value is cached.
-        if len(self.queryset._query) == 1:
+        # If no filters were given, reuse the paginator count; otherwise count
+        # through another paginator so its estimate and cache settings apply.
+        if not show_full_result_count:
+            full_result_count = None
+        elif not filtered:
             full_result_count = result_count
-        else:
-            full_result_count = self.root_queryset.count()
+        elif not facet:
+            full_result_count = self.model_admin.get_paginator(
+                request, self.root_queryset, self.list_per_page
+            ).count
 
         can_show_all = result_count <= self.list_max_show_all
         multi_page = result_count > self.list_per_page
 
         # Get the list of objects to display on this page.
+        self.page = None
+        self.next_page_url = self.previous_page_url = None
         if (self.show_all and can_show_all) or not multi_page:
             result_list = self.queryset.clone()
+        elif isinstance(paginator, KeysetPaginator):
+            try:
+                self.page = paginator.page(request.GET.get(CURSOR_VAR))
+            except InvalidPage:
+                raise IncorrectLookupParameters
+            result_list = self.page.object_list
+            if self.page.has_next():
+                self.next_page_url = self.get_cursor_url(self.page.next_cursor)
+            if self.page.has_previous():
+                self.previous_page_url = self.get_cursor_url(self.page.previous_cursor)
         else:
             try:
-                result_list = paginator.page(self.page_num).object_list
+                page = paginator.page(self.page_num)
             except InvalidPage:
                 raise IncorrectLookupParameters
+            result_list = page.object_list
+            # Capped counts don't number the pages past them.
+            if getattr(paginator, "count_is_capped", False) and page.has_next():
+                self.next_page_url = self.get_query_string({PAGE_VAR: self.page_num + 1})
 
         self.result_count = result_count
+        self.show_full_result_count = show_full_result_count
+        # Admin actions are shown if there is at least one entry
+        # or if entries are not counted because show_full_result_count is disabled
+        self.show_admin_actions = not show_full_result_count or bool(full_result_count)
+        self.result_count_is_capped = getattr(paginator, "count_is_capped", False)
+        self.page_range = []
+        if multi_page and not (self.show_all and can_show_all):
+            self.page_range = paginator.get_elided_page_range(self.page_num)
         self.full_result_count = full_result_count
         self.result_list = result_list
         self.can_show_all = can_show_all
         self.multi_page = multi_page
         self.paginator = paginator
 
+    def get_facet_counts(self):
+        """
+        Returns ``(result_count, full_result_count)`` computed with one
+        ``$facet`` aggregation over the root queryset, on the database and
+        with the read preference it was routed to.
+        """
+        pipeline = [
+            {
+                "$facet": {
+                    "result": [{"$match": self.queryset._query}, {"$count": "count"}],
+                    "full_result": [{"$count": "count"}],
+                }
+            },
+        ]
+        counts = next(self.root_queryset.order_by().aggregate(pipeline))
+        return tuple(
+            counts[name][0]["count"] if counts[name] else 0 for name in ("result", "full_result")
+        )
+
+    def get_cursor_url(self, cursor):
+        """
+        Returns the changelist query string for a KeysetPaginator cursor.
+        """
+        return self.get_query_string({CURSOR_VAR: cursor})
+
     def _get_default_ordering(self):
         try:
             ordering = super()._get_default_ordering()
@@ -105,6 +195,10 @@ class DocumentChangeList(ChangeList):
         return ordering
 
     def get_queryset(self, request=None):
+        # Route the change list queries, and the full result count, before
+        # anything else.
+        self.root_queryset = router.route_queryset(self.root_queryset, view=self, request=request)
+
         # First, we collect all the declared list filters.
         qs = self.root_queryset.clone()
 
@@ -151,4 +245,33 @@ class DocumentChangeList(ChangeList):
             self.query,
         )
 
+        if not qs._prefetch_related_lookups:
+            qs = self.apply_select_related(qs)
+
         return qs
+
+    def apply_select_related(self, qs):
+        # Reference fields are dereferenced with prefetch_related(), as
+        # mongoengine's select_related() returns a list. With
+        # list_select_related = False, only those shown in list_display are.
+        if self.list_select_related is True:
+            fields = reference_fields(self.model)
+        elif self.list_select_related is False:
+            fields = self.get_related_fields_in_list_display()
+        else:
+            fields = self.list_select_related
+        return qs.prefetch_related(*fields) if fields else qs
+
+    def get_related_fields_in_list_display(self):
+        fields = []
+        for field_name in self.list_display:
+            try:
+                field = self.lookup_opts.get_field(field_name)
+            except FieldDoesNotExist:
+                continue
+            if self.model._fields.get(field.name) is field and referenced_document(field):
+                fields.append(field.name)
+        return fields
+
+    def has_related_field_in_list_display(self):
+        return bool(self.get_related_fields_in_list_display())
@@ -1,4 +1,46 @@
+from django.conf import settings
 from django.contrib.auth import backends as django_backends
+from django.core.cache import caches
+from mongoengine import signals
+
+from .managers import get_user_document
+from .models import ContentType, Permission
+
+USER_CACHE_KEY_PREFIX = "django_mongoengine.mongo_auth.user."
+
+
+def get_user_cache():
+    return caches[getattr(settings, "MONGOENGINE_USER_CACHE_ALIAS", "default")]
+
+
+def invalidate_cached_user(sender, document, **kwargs):
+    """
+    Drops a saved or deleted user document from the get_user() cache.
+    """
+    if getattr(settings, "MONGOENGINE_USER_CACHE_TIMEOUT", None):
+        get_user_cache().delete(USER_CACHE_KEY_PREFIX + str(document.pk))
+
+
+_cache_signal_senders = set()
+
+
+def connect_user_cache_signals():
+    """
+    Connects invalidate_cached_user() to the saves and deletes of the user
+    document, if ``MONGOENGINE_USER_CACHE_TIMEOUT`` is set.
+
+    Receivers are only connected for the user document: connected save
+    signals keep ``get_or_create()`` from upserting.
+    """
+    if not signals.signals_available or not getattr(
+        settings, "MONGOENGINE_USER_CACHE_TIMEOUT", None
+    ):
+        return
+    document = get_user_document()
+    if document not in _cache_signal_senders:
+        signals.post_save.connect(invalidate_cached_user, sender=document)
+        signals.post_delete.connect(invalidate_cached_user, sender=document)
+        _cache_signal_senders.add(document)
 
 
 class MongoEngineBackend:
@@ -9,8 +51,80 @@ class MongoEngineBackend:
     supports_inactive_user = False
 
     authenticate = django_backends.ModelBackend.__dict__["authenticate"]
-    get_user = django_backends.ModelBackend.__dict__["get_user"]
+    _get_user = django_backends.ModelBackend.__dict__["get_user"]
     try:
         user_can_authenticate = django_backends.ModelBackend.__dict__["user_can_authenticate"]
     except KeyError:
         pass  # it's okay for django < 1.9
+
+    def get_user(self, user_id):
+        """
+        Returns the user document with the given pk. If
+        ``MONGOENGINE_USER_CACHE_TIMEOUT`` is set, it's kept that many
+        seconds in the ``MONGOENGINE_USER_CACHE_ALIAS`` cache, until it is
+        saved or deleted.
+
+        Writes which don't go through ``save()`` or ``delete()``, like
+        ``User.objects.update()``, don't invalidate the cache.
+        """
+        timeout = getattr(settings, "MONGOENGINE_USER_CACHE_TIMEOUT", None)
+        if not timeout or not signals.signals_available:
+            return self._get_user(user_id)
+        # Also done when the app is ready, unless the setting was changed
+        # afterwards.
+        connect_user_cache_signals()
+
+        cache = get_user_cache()
+        key = USER_CACHE_KEY_PREFIX + str(user_id)
+        son = cache.get(key)
+        if son is not None:
+            return get_user_document()._from_son(son)
+        user = self._get_user(user_id)
+        if user is not None:
+            cache.set(key, user.to_mongo().to_dict(), timeout)
+        return user
+
+    def _get_permissions(self, user_obj, obj, from_name):
+        """
+        Returns the permissions of ``user_obj`` from ``from_name`` ("user",
+        "group" or "all"), resolved in one aggregation and cached on the
+        user document by ``AbstractUser._get_permissions()``.
+        """
+        if not user_obj.is_active or user_obj.is_anonymous or obj is not None:
+            return set()
+        if getattr(user_obj, "is_superuser", False):
+            return self._get_superuser_permissions(user_obj)
+        get_permissions = getattr(user_obj, "_get_permissions", None)
+        if get_permissions is None:
+            return set()
+        return get_permissions(from_name)
+
+    def _get_superuser_permissions(self, user_obj):
+        """
+        Returns every permission, like ModelBackend does for superusers,
+        cached on the user document.
+        """
+        if not hasattr(user_obj, "_superuser_perm_cache"):
+            perms = set()
+            for perm in Permission.objects.only("content_type", "codename").as_pymongo():
+                try:
+                    content_type = ContentType.objects.get_for_id(perm.get("content_type"))
+                except ContentType.DoesNotExist:
+                    continue
+                perms.add("%s.%s" % (content_type.app_label, perm.get("codename")))
+            user_obj._superuser_perm_cache = perms
+        return user_obj._superuser_perm_cache
+
+    def get_user_permissions(self, user_obj, obj=None):
+        return self._get_permissions(user_obj, obj, "user")
+
+    def get_group_permissions(self, user_obj, obj=None):
+        return self._get_permissions(user_obj, obj, "group")
+
+    def get_all_permissions(self, user_obj, obj=None):
+        return self._get_permissions(user_obj, obj, "all")
+
+    def has_perm(self, user_obj, perm, obj=None):
+        return user_obj.is_active and perm in self.get_all_permissions(user_obj, obj)
+
+    has_module_perms = django_backends.ModelBackend.__dict__["has_module_perms"]
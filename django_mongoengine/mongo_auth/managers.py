@@ -1,7 +1,9 @@
+import functools
 from importlib import import_module
 
 from django.conf import settings
 from django.contrib.auth.models import UserManager
+from django.core.signals import setting_changed
 from django.db.models import BooleanField, CharField, DateTimeField
 from django.utils.translation import gettext_lazy as _
 from mongoengine.errors import DoesNotExist
@@ -11,20 +13,30 @@ MONGOENGINE_USER_DOCUMENT = getattr(
 )
 
 
+@functools.lru_cache(maxsize=None)
 def get_user_document():
     """Get the user document class used for authentication.
 
     This is the class defined in settings.MONGOENGINE_USER_DOCUMENT, which
-    defaults to `mongoengine.django.auth.User`.
+    defaults to `mongoengine.django.auth.User`. It is imported once, and
+    again when the setting is changed.
 
     """
 
-    name = MONGOENGINE_USER_DOCUMENT
+    name = getattr(settings, "MONGOENGINE_USER_DOCUMENT", MONGOENGINE_USER_DOCUMENT)
     dot = name.rindex(".")
     module = import_module(name[:dot])
     return getattr(module, name[dot + 1 :])
 
 
+def reset_user_document(*, setting, **kwargs):
+    if setting == "MONGOENGINE_USER_DOCUMENT":
+        get_user_document.cache_clear()
+
+
+setting_changed.connect(reset_user_document)
+
+
 class MongoUserManager(UserManager):
     """A User manager wich allows the use of MongoEngine documents in Django.
 
@@ -93,12 +105,17 @@ class MongoUserManager(UserManager):
     def db(self):
         raise NotImplementedError
 
+    @property
+    def user_document(self):
+        """The user document class, see get_user_document()."""
+        return get_user_document()
+
     def get_queryset(self):
-        return get_user_document().objects
+        return self.user_document.objects
 
     def create_superuser(self, username, email, password, **extra_fields):
         """since we use mongo as our database, we don't use
         django's rule to create a superuser, such as 'python manage.py createsuperuser'.
         We use mongo's rule --'python manage.py createmongosuperuser instead.
         """
-        return get_user_document().create_superuser(username, password, email)
+        return self.user_document.create_superuser(username, password, email)
@@ -7,32 +7,91 @@ from django.contrib.auth.models import (
     _user_has_module_perms,
     _user_has_perm,
 )
-from django.contrib.contenttypes.models import ContentTypeManager
 from django.db import models
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
-from mongoengine import ImproperlyConfigured
+from mongoengine import ImproperlyConfigured, signals
 
 from django_mongoengine import document, fields
-from django_mongoengine.queryset import QuerySetManager
+from django_mongoengine.queryset import QuerySet, QuerySetManager
 
 from django.contrib.auth.hashers import check_password, make_password
 from .managers import MongoUserManager
 
 
-def ct_init(self, *args, **kwargs):
-    super(QuerySetManager, self).__init__(*args, **kwargs)
-    self._cache = {}
+class ContentTypeQuerySet(QuerySet):
+    """
+    QuerySet with the lookups of django's ContentTypeManager. They are
+    answered from a process-wide cache of all content types, keyed by
+    ``(app_label, model)`` and pk, which is loaded with one query on first
+    use and cleared when a content type is saved or deleted.
+    """
 
+    _cache = None
 
-ContentTypeManager = type(
-    "ContentTypeManager",
-    (QuerySetManager,),
-    dict(
-        ContentTypeManager.__dict__,
-        __init__=ct_init,
-    ),
-)
+    def _get_cache(self):
+        cache = ContentTypeQuerySet._cache
+        if cache is None:
+            cache = {}
+            for ct in self._document.objects.all():
+                cache[(ct.app_label, ct.model)] = cache[ct.pk] = ct
+            ContentTypeQuerySet._cache = cache
+        return cache
+
+    def _add_to_cache(self, ct):
+        cache = self._get_cache()
+        cache[(ct.app_label, ct.model)] = cache[ct.pk] = ct
+
+    def get_by_natural_key(self, app_label, model):
+        try:
+            return self._get_cache()[(app_label, model)]
+        except KeyError:
+            ct = self.get(app_label=app_label, model=model)
+            self._add_to_cache(ct)
+            return ct
+
+    def get_for_model(self, model, for_concrete_model=True):
+        """
+        Returns the ContentType of a model or document class, creating it if
+        necessary.
+        """
+        opts = model._meta
+        if for_concrete_model and getattr(opts, "concrete_model", None) is not None:
+            opts = opts.concrete_model._meta
+        try:
+            return self._get_cache()[(opts.app_label, opts.model_name)]
+        except KeyError:
+            pass
+        ct, _created = self.get_or_create(
+            app_label=opts.app_label, model=opts.model_name, defaults={"name": opts.model_name}
+        )
+        self._add_to_cache(ct)
+        return ct
+
+    def get_for_models(self, *models, for_concrete_models=True):
+        """
+        Returns a dictionary mapping ``{model: content_type}``.
+        """
+        return {model: self.get_for_model(model, for_concrete_models) for model in models}
+
+    def get_for_id(self, id):
+        id = self._document._fields["id"].to_python(id)
+        try:
+            return self._get_cache()[id]
+        except KeyError:
+            ct = self.get(pk=id)
+            self._add_to_cache(ct)
+            return ct
+
+    def clear_cache(self):
+        """
+        Clears the content type cache.
+        """
+        ContentTypeQuerySet._cache = None
+
+
+class ContentTypeManager(QuerySetManager):
+    default = ContentTypeQuerySet
 
 
 class BaseUser:
@@ -84,6 +143,15 @@ class ContentType(document.Document):
         return (self.app_label, self.model)
 
 
+def clear_content_type_cache(sender, document, **kwargs):
+    ContentTypeQuerySet._cache = None
+
+
+if signals.signals_available:
+    signals.post_save.connect(clear_content_type_cache, sender=ContentType)
+    signals.post_delete.connect(clear_content_type_cache, sender=ContentType)
+
+
 class SiteProfileNotAvailable(Exception):
     pass
 
@@ -132,15 +200,23 @@ class Permission(document.Document):
         # unique_together = (('content_type', 'codename'),)
         # ordering = ('content_type__app_label', 'content_type__model', 'codename')
 
+    def _get_content_type(self):
+        # Read the content type from the cache instead of dereferencing it.
+        content_type = self._data.get("content_type")
+        if content_type is None or isinstance(content_type, ContentType):
+            return content_type
+        return ContentType.objects.get_for_id(getattr(content_type, "id", content_type))
+
     def __str__(self):
+        content_type = self._get_content_type()
         return "%s | %s | %s" % (
-            self.content_type.app_label,
-            self.content_type,
+            content_type.app_label,
+            content_type,
             self.name,
         )
 
     def natural_key(self):
-        return (self.codename,) + self.content_type.natural_key()
+        return (self.codename,) + self._get_content_type().natural_key()
 
     natural_key.dependencies = ["contenttypes.contenttype"]
 
@@ -303,6 +379,114 @@ class AbstractUser(BaseUser, document.Document):
                 permissions.update(backend.get_group_permissions(self, obj))
         return permissions
 
+    def _load_permissions(self):
+        """
+        Resolves the permissions of the user, and of its ``groups`` if the
+        document has such a field, to ``app_label.codename`` strings with a
+        single aggregation. The Permission, Group and ContentType collections
+        must be in the database of the user.
+        """
+        self._user_perm_cache = set()
+        self._group_perm_cache = set()
+        if self.pk is None:
+            self._perm_cache = set()
+            return
+
+        pipeline = [{"$match": {"_id": self.pk}}]
+        group_permissions = []
+        if "groups" in self._fields:
+            pipeline.append(
+                {
+                    "$lookup": {
+                        "from": Group._get_collection_name(),
+                        "localField": self._fields["groups"].db_field,
+                        "foreignField": "_id",
+                        "as": "groups",
+                    }
+                }
+            )
+            group_permissions = {
+                "$reduce": {
+                    "input": "$groups.permissions",
+                    "initialValue": [],
+                    "in": {"$concatArrays": ["$$value", "$$this"]},
+                }
+            }
+        permission_collection = Permission._get_collection_name()
+        pipeline += [
+            {
+                "$project": {
+                    "user": {"$ifNull": ["$" + self._fields["user_permissions"].db_field, []]},
+                    "group": group_permissions,
+                }
+            },
+            {
+                "$lookup": {
+                    "from": permission_collection,
+                    "localField": "user",
+                    "foreignField": "_id",
+                    "as": "user",
+                }
+            },
+            {
+                "$lookup": {
+                    "from": permission_collection,
+                    "localField": "group",
+                    "foreignField": "_id",
+                    "as": "group",
+                }
+            },
+            {
+                "$addFields": {
+                    "content_types": {
+                        "$concatArrays": ["$user.content_type", "$group.content_type"]
+                    }
+                }
+            },
+            {
+                "$lookup": {
+                    "from": ContentType._get_collection_name(),
+                    "localField": "content_types",
+                    "foreignField": "_id",
+                    "as": "content_types",
+                }
+            },
+            {
+                "$project": {
+                    "user.codename": 1,
+                    "user.content_type": 1,
+                    "group.codename": 1,
+                    "group.content_type": 1,
+                    "content_types._id": 1,
+                    "content_types.app_label": 1,
+                }
+            },
+        ]
+        result = next(type(self)._get_collection().aggregate(pipeline), None) or {}
+
+        app_labels = {ct["_id"]: ct.get("app_label") for ct in result.get("content_types", [])}
+        for name, perms in (("user", self._user_perm_cache), ("group", self._group_perm_cache)):
+            for perm in result.get(name, []):
+                app_label = app_labels.get(perm.get("content_type"))
+                if app_label is not None:
+                    perms.add("%s.%s" % (app_label, perm.get("codename")))
+        self._perm_cache = self._user_perm_cache | self._group_perm_cache
+
+    def _get_permissions(self, from_name="all"):
+        """
+        Returns the set of ``app_label.codename`` permissions of the user
+        from ``"user"`` permissions, ``"group"`` permissions or ``"all"``.
+        Inactive users have none. The sets are cached on the instance, like
+        ModelBackend does, and read by ``MongoEngineBackend``.
+        """
+        if not self.is_active:
+            return set()
+        if not hasattr(self, "_perm_cache"):
+            self._load_permissions()
+        if from_name == "all":
+            return self._perm_cache
+        return getattr(self, "_%s_perm_cache" % from_name)
+
     def get_all_permissions(self, obj=None):
         return _user_get_permissions(self, obj, "all")
 
@@ -1,11 +1,302 @@
-from django.core.paginator import Paginator
+from bson import json_util
+from django.core import signing
+from django.core.cache import caches
+from django.core.paginator import EmptyPage, InvalidPage, Page, Paginator
+from django.utils.crypto import md5
 from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+from mongoengine.queryset.base import BaseQuerySet
+
+_unset = object()
+
+
+class CappedPage(Page):
+    """
+    A page of a :class:`Paginator` whose count is capped. Whether there is
+    a next page is known from fetching one more document than the page
+    holds, not from ``num_pages``.
+    """
+
+    def __init__(self, object_list, number, paginator, has_more):
+        super().__init__(object_list, number, paginator)
+        self.has_more = has_more
+
+    def has_next(self):
+        return self.has_more
 
 
 class Paginator(Paginator):
+    """
+    Paginator for mongoengine querysets.
+
+    How ``count`` is computed can be tuned per paginator class, or with the
+    matching keyword arguments:
+
+    * ``estimate_count`` - use ``estimatedDocumentCount`` (collection
+      metadata) for querysets without any filter.
+    * ``max_count`` - stop counting after this many documents; ``count`` is
+      then ``max_count`` and ``count_is_capped`` is True, so templates can
+      show "more than 10,000 results".
+    * ``count_cache`` - alias of a Django cache to keep counts in for
+      ``count_cache_timeout`` seconds.
+
+    A capped count only limits what is displayed: pages past ``num_pages``
+    can still be reached as long as they have results.
+    """
+
+    estimate_count = False
+    max_count = None
+    count_cache = None
+    count_cache_timeout = 60
+
+    count_is_capped = False
+    count_is_estimated = False
+
+    def __init__(self, object_list, per_page, orphans=0, allow_empty_first_page=True, **kwargs):
+        for option in ("estimate_count", "max_count", "count_cache", "count_cache_timeout"):
+            value = kwargs.pop(option, _unset)
+            if value is not _unset:
+                setattr(self, option, value)
+        super().__init__(object_list, per_page, orphans, allow_empty_first_page, **kwargs)
+
     @cached_property
     def count(self):
+        if not isinstance(self.object_list, BaseQuerySet):
+            try:
+                return self.object_list.count()
+            except TypeError:
+                return len(self.object_list)
+
+        if self.count_cache is None:
+            count, self.count_is_capped, self.count_is_estimated = self._count_queryset()
+            return count
+
+        cache = caches[self.count_cache]
+        key = self._count_cache_key()
+        result = cache.get(key)
+        if result is None:
+            result = self._count_queryset()
+            cache.set(key, result, self.count_cache_timeout)
+        count, self.count_is_capped, self.count_is_estimated = result
+        return count
+
+    def validate_number(self, number):
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            if not self.count_is_capped:
+                raise
+            number = int(number)
+            if number < 1 or not self._page_has_results(number):
+                raise
+            return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if not self.count_is_capped:
+            return super().page(number)
+        bottom = (number - 1) * self.per_page
+        object_list = list(self.object_list.clone().skip(bottom).limit(self.per_page + 1))
+        return CappedPage(
+            object_list[: self.per_page], number, self, len(object_list) > self.per_page
+        )
+
+    def _page_has_results(self, number):
+        queryset = self.object_list.clone().skip((number - 1) * self.per_page).limit(1)
+        return queryset.count(with_limit_and_skip=True) > 0
+
+    def _count_queryset(self):
+        """
+        Returns ``(count, capped, estimated)`` for the queryset.
+        """
+        queryset = self.object_list
+        unfiltered = not (
+            queryset._query
+            or queryset._where_clause
+            or queryset._none
+            or queryset._empty
+            or queryset._limit is not None
+            or queryset._skip
+        )
+        if self.estimate_count and unfiltered:
+            count = queryset._collection.estimated_document_count()
+            if self.max_count is not None and count > self.max_count:
+                return self.max_count, True, True
+            return count, False, True
+
+        if self.max_count is not None and queryset._limit is None and not queryset._skip:
+            count = queryset.clone().limit(self.max_count + 1).count(with_limit_and_skip=True)
+            if count > self.max_count:
+                return self.max_count, True, False
+            return count, False, False
+
+        return queryset.count(), False, False
+
+    def _count_cache_key(self):
+        queryset = self.object_list
+        query = json_util.dumps(
+            [
+                queryset._collection.full_name,
+                queryset._query,
+                queryset._where_clause,
+                queryset._none or queryset._empty,
+                queryset._limit,
+                queryset._skip,
+                self.estimate_count,
+                self.max_count,
+            ],
+            sort_keys=True,
+        )
+        digest = md5(query.encode(), usedforsecurity=False).hexdigest()
+        return "django_mongoengine.paginator.count.%s" % digest
+
+
+class KeysetPage(Page):
+    """
+    A page of a :class:`KeysetPaginator`.
+
+    Pages have no number; neighbours are addressed by the opaque
+    ``next_cursor`` and ``previous_cursor`` tokens instead.
+    """
+
+    def __init__(self, object_list, paginator, next_cursor=None, previous_cursor=None):
+        super().__init__(object_list, None, paginator)
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __repr__(self):
+        return "<Keyset page of %s objects>" % len(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def next_page_number(self):
+        if self.next_cursor is None:
+            raise EmptyPage(_("That page contains no results"))
+        return self.next_cursor
+
+    def previous_page_number(self):
+        if self.previous_cursor is None:
+            raise EmptyPage(_("That page contains no results"))
+        return self.previous_cursor
+
+
+class KeysetPaginator(Paginator):
+    """
+    Paginator which seeks to a page with range filters on the ordering
+    fields instead of skipping over the preceding documents, so deep pages
+    cost the same as the first one.
+
+    The queryset ordering (or the document's default ``ordering``) is used
+    as the keyset, with ``_id`` appended as a tie breaker. Ordering fields
+    should be indexed and never null.
+
+    ``page()`` takes an opaque cursor returned by
+    ``KeysetPage.next_cursor`` / ``KeysetPage.previous_cursor``, or
+    ``None`` for the first page.
+    """
+
+    salt = "django_mongoengine.paginator.KeysetPaginator"
+
+    def __iter__(self):
+        page = self.page()
+        yield page
+        while page.has_next():
+            page = self.page(page.next_cursor)
+            yield page
+
+    @cached_property
+    def keys(self):
+        """
+        Returns the list of ``(db_field, direction)`` tuples the pages are
+        sorted and filtered by.
+        """
+        queryset = self.object_list
+        keys = list(queryset._ordering or [])
+        if queryset._ordering is None and queryset._document._meta.get("ordering"):
+            keys = queryset._get_order_by(queryset._document._meta["ordering"])
+        if "_id" not in dict(keys):
+            keys.append(("_id", keys[-1][1] if keys else 1))
+        return keys
+
+    def encode_cursor(self, direction, document):
+        son = document.to_mongo()
+        values = []
+        for key, _direction in self.keys:
+            value = son
+            for part in key.split("."):
+                value = value.get(part) if hasattr(value, "get") else None
+            values.append(value)
+        return signing.dumps(json_util.dumps([direction, values]), salt=self.salt, compress=True)
+
+    def decode_cursor(self, cursor):
+        try:
+            direction, values = json_util.loads(signing.loads(cursor, salt=self.salt))
+        except (signing.BadSignature, ValueError, TypeError):
+            raise InvalidPage(_("That page cursor is not valid"))
+        if direction not in ("next", "previous") or len(values) != len(self.keys):
+            raise InvalidPage(_("That page cursor is not valid"))
+        return direction, values
+
+    def _seek_query(self, values, reverse=False):
+        """
+        Builds ``(k1 > v1) or (k1 == v1 and k2 > v2) or ...`` for the keyset,
+        with the comparisons flipped for descending keys and ``reverse``.
+        """
+        clauses = []
+        for i, (key, direction) in enumerate(self.keys):
+            ascending = (direction == 1) != reverse
+            clause = {k: v for (k, _direction), v in zip(self.keys[:i], values)}
+            clause[key] = {"$gt" if ascending else "$lt": values[i]}
+            clauses.append(clause)
+        return {"$or": clauses}
+
+    def page(self, cursor=None):
+        """
+        Returns a KeysetPage for the given cursor, or the first page if no
+        cursor is given.
+        """
+        direction, values = "next", None
+        if cursor not in (None, "", 1, "1"):
+            direction, values = self.decode_cursor(cursor)
+        reverse = direction == "previous"
+
+        sort = [(key, -d if reverse else d) for key, d in self.keys]
+        queryset = self.object_list.clone().order_by(__raw__=sort)
+        if values is not None:
+            queryset = queryset.filter(__raw__=self._seek_query(values, reverse))
+        object_list = list(queryset.limit(self.per_page + 1))
+        has_more = len(object_list) > self.per_page
+        object_list = object_list[: self.per_page]
+        if reverse:
+            object_list.reverse()
+
+        if not object_list:
+            if values is not None or not self.allow_empty_first_page:
+                raise EmptyPage(_("That page contains no results"))
+            return KeysetPage(object_list, self)
+
+        next_cursor = previous_cursor = None
+        if has_more or reverse:
+            next_cursor = self.encode_cursor("next", object_list[-1])
+        if (has_more and reverse) or (values is not None and not reverse):
+            previous_cursor = self.encode_cursor("previous", object_list[0])
+        return KeysetPage(object_list, self, next_cursor, previous_cursor)
+
+    def get_elided_page_range(self, number=1, *, on_each_side=3, on_ends=2):
+        # Keyset pages are addressed by cursors, there are no page numbers
+        # to link to.
+        return []
+
+    def get_page(self, cursor=None):
+        """
+        Returns a valid page, falling back to the first one if the cursor is
+        invalid or points past the end.
+        """
         try:
-            return self.object_list.count()
-        except TypeError:
-            return len(self.object_list)
+            return self.page(cursor)
+        except InvalidPage:
+            return self.page(None)
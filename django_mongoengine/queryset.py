@@ -1,12 +1,26 @@
 from __future__ import annotations
 
+from itertools import islice
 from typing import TYPE_CHECKING, Generic, TypeVar
 
+from bson.dbref import DBRef
+from bson.objectid import ObjectId
+from django.core.exceptions import FieldDoesNotExist, FieldError
 from django.db.models.query import QuerySet as DjangoQuerySet
 from django.db.models.utils import resolve_callables
+from mongoengine import document as me
 from mongoengine import queryset as qs
-from mongoengine.errors import NotUniqueError
+from mongoengine import signals
+from mongoengine.base import BaseList
+from mongoengine.connection import DEFAULT_CONNECTION_NAME, get_db
+from mongoengine.errors import BulkWriteError as BaseBulkWriteError
+from mongoengine.errors import NotUniqueError, OperationError, ValidationError
+from mongoengine.fields import ListField, ObjectIdField, ReferenceField
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError as PyMongoBulkWriteError
+from pymongo.errors import OperationFailure
 
+from .router import router
 from .utils.monkey import patch_typing_support
 
 if TYPE_CHECKING:
@@ -14,9 +28,61 @@ if TYPE_CHECKING:
 
 _M = TypeVar("_M", bound="Document")
 
+# Default batch size of BaseQuerySet.iterator(), same as django's.
+ITERATOR_CHUNK_SIZE = 2000
+
 patch_typing_support()
 
 
+class BulkWriteError(BaseBulkWriteError):
+    """
+    Raised by bulk_create() and bulk_update() when some batches failed.
+
+    ``errors`` is a list of ``(batch_number, details)`` tuples, where
+    ``details`` is pymongo's bulk write result for that batch.
+    """
+
+    def __init__(self, message, errors):
+        super().__init__(message)
+        self.errors = errors
+
+
+def _batches(items, batch_size):
+    if batch_size is not None and batch_size <= 0:
+        raise ValueError("Batch size must be a positive integer.")
+    batch_size = batch_size or len(items) or 1
+    for start in range(0, len(items), batch_size):
+        yield items[start : start + batch_size]
+
+
+def _failed_indexes(details, size, ordered):
+    failed = {error["index"] for error in details.get("writeErrors", [])}
+    if ordered and failed:
+        # Ordered writes stop at the first error.
+        failed.update(range(min(failed), size))
+    return failed
+
+
+def referenced_document(field):
+    """
+    Returns the document type referenced by a ``ReferenceField``, or by the
+    items of a ``ListField``, else None.
+    """
+    if isinstance(field, ListField):
+        field = field.field
+    if isinstance(field, ReferenceField):
+        return field.document_type
+    return None
+
+
+def reference_fields(document):
+    """
+    Returns the names of the fields of ``document`` which reference other
+    documents (see ``referenced_document()``).
+    """
+    return [name for name, field in document._fields.items() if referenced_document(field)]
+
+
 class QueryWrapper:
     # XXX: copy funcs from django; now it's just wrapper
     select_related = False
@@ -32,6 +98,13 @@ class BaseQuerySet(Generic[_M]):
     A base queryset with django-required attributes
     """
 
+    # Alias of the collection, if it was switched by using() or routed().
+    _db_alias = None
+    # Alias queryset writes are sent to, if routed() chose another one.
+    _write_alias = None
+    # Reference fields picked by prefetch_related().
+    _related_fields = None
+
     @property
     def model(self) -> type[_M]:
         return self._document
@@ -44,11 +117,94 @@ class BaseQuerySet(Generic[_M]):
     def _prefetch_related_lookups(self):
         # Originally used in django for prefetch_related(),
         # see https://docs.djangoproject.com/en/1.9/ref/models/querysets/#prefetch-related
-        # returning empty list to presume that no query prefetch is required
-        return []
+        return list(self._related_fields or [])
 
-    def iterator(self):
-        return self
+    def prefetch_related(self, *fields):
+        """
+        Returns a copy of the queryset which dereferences the given
+        ``ReferenceField`` fields (or ``ListField`` of them) of its results
+        with one ``$in`` query per field and batch of results, instead of one
+        query per document when the field is accessed.
+
+        ``prefetch_related(None)`` clears the list. ``select_related()`` is
+        still mongoengine's, which dereferences up to ``max_depth`` levels
+        and returns a list.
+        """
+        queryset = self.clone()
+        if fields == (None,):
+            queryset._related_fields = None
+            return queryset
+        if not fields:
+            return queryset
+        invalid = [f for f in fields if referenced_document(self._document._fields.get(f)) is None]
+        if invalid:
+            raise FieldError(
+                "Invalid field name(s) given in prefetch_related: %s. Choices are: %s"
+                % (", ".join(invalid), ", ".join(reference_fields(self._document)) or "(none)")
+            )
+        current = self._related_fields or ()
+        queryset._related_fields = current + tuple(f for f in fields if f not in current)
+        return queryset
+
+    def _dereference_related(self, docs):
+        document = self._document
+        for name in self._related_fields:
+            field = document._fields[name]
+            many = isinstance(field, ListField)
+            ids = set()
+            for doc in docs:
+                value = doc._data.get(name)
+                for ref in (value or ()) if many else (value,):
+                    if isinstance(ref, DBRef):
+                        ids.add(ref.id)
+            if not ids:
+                continue
+
+            referenced = referenced_document(field)
+            fetched = {
+                son["_id"]: referenced._from_son(son)
+                for son in referenced.objects(pk__in=list(ids)).as_pymongo()
+            }
+            for doc in docs:
+                value = doc._data.get(name)
+                if many and value:
+                    value = BaseList(
+                        [
+                            fetched.get(ref.id, ref) if isinstance(ref, DBRef) else ref
+                            for ref in value
+                        ],
+                        doc,
+                        name,
+                    )
+                    # Don't let the field dereference the list again.
+                    value._dereferenced = True
+                    doc._data[name] = value
+                elif isinstance(value, DBRef) and value.id in fetched:
+                    doc._data[name] = fetched[value.id]
+
+    def iterator(self, chunk_size=None):
+        """
+        Yields the documents from a non-caching cursor which fetches
+        ``chunk_size`` documents per batch (2000 by default), so memory use
+        doesn't grow with the number of documents iterated.
+
+        Fields given to ``prefetch_related()`` are dereferenced for each
+        chunk of ``chunk_size`` documents.
+        """
+        if chunk_size is None:
+            chunk_size = ITERATOR_CHUNK_SIZE
+        elif chunk_size <= 0:
+            raise ValueError("Chunk size must be strictly positive.")
+        queryset = self._clone_into(QuerySetNoCache(self._document, self._collection))
+        docs = iter(queryset.batch_size(chunk_size))
+        if self._related_fields is None:
+            return docs
+        return self._prefetch_chunks(docs, chunk_size)
+
+    def _prefetch_chunks(self, docs, chunk_size):
+        while chunk := list(islice(docs, chunk_size)):
+            self._dereference_related(chunk)
+            yield from chunk
 
     def get_queryset(self):
         return self
@@ -60,11 +216,94 @@ class BaseQuerySet(Generic[_M]):
         return self.order_by(field_name).first()
 
     def exists(self) -> bool:
-        return bool(self)
+        """
+        Returns True if the queryset matches any document.
+
+        Unless the results are already cached, this runs a ``find`` projected
+        on ``_id`` with ``limit(1)`` and builds no documents.
+        """
+        result_cache = getattr(self, "_result_cache", None)
+        if result_cache:
+            return True
+        if result_cache is not None and not self._has_more:
+            return False
+        if self._none or self._empty or self._limit == 0:
+            return False
+        if self._where_clause:
+            return self.order_by().only("pk").first() is not None
+
+        collection = self._collection
+        if self._read_preference is not None or self._read_concern is not None:
+            collection = collection.with_options(
+                read_preference=self._read_preference, read_concern=self._read_concern
+            )
+        kwargs = {}
+        if self._skip:
+            kwargs["skip"] = self._skip
+        if self._hint not in (-1, None):
+            kwargs["hint"] = self._hint
+        if self._collation is not None:
+            kwargs["collation"] = self._collation
+        return collection.find_one(self._query, {"_id": 1}, **kwargs) is not None
 
     def _clone(self):
         return self.clone()
 
+    def _clone_into(self, new_qs):
+        new_qs = super()._clone_into(new_qs)
+        if isinstance(new_qs, BaseQuerySet):
+            new_qs._db_alias = self._db_alias
+            new_qs._write_alias = self._write_alias
+            new_qs._related_fields = self._related_fields
+        return new_qs
+
+    def _with_alias(self, alias):
+        # Unlike using(), this doesn't reset the document's collection, which
+        # would ensure its indexes again each time.
+        collection = get_db(alias)[self._document._get_collection_name()]
+        queryset = self._clone_into(self.__class__(self._document, collection))
+        queryset._db_alias = alias
+        return queryset
+
+    def using(self, alias):
+        queryset = super().using(alias)
+        queryset._db_alias = alias
+        queryset._write_alias = None
+        return queryset
+
+    def routed(self, **hints):
+        """
+        Returns a copy of the queryset reading from the alias, and with the
+        read preference, chosen by ``MONGODB_ROUTERS``. Its update, delete
+        and bulk writes go to the alias chosen by ``db_for_write``.
+        """
+        document = self._document
+        alias = router.db_for_read(document, **hints)
+        write_alias = router.db_for_write(document, **hints)
+        if alias != (self._db_alias or document._meta.get("db_alias", DEFAULT_CONNECTION_NAME)):
+            queryset = self._with_alias(alias)
+        else:
+            queryset = self.clone()
+        queryset._write_alias = write_alias if write_alias != alias else None
+        read_preference = router.read_preference(document, **hints)
+        if read_preference is not None:
+            queryset = queryset.read_preference(read_preference)
+        return queryset
+
+    def _write_queryset(self):
+        if self._write_alias is None:
+            return self
+        return self._with_alias(self._write_alias)
+
+    def update(self, *args, **kwargs):
+        return super(BaseQuerySet, self._write_queryset()).update(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        return super(BaseQuerySet, self._write_queryset()).delete(*args, **kwargs)
+
+    def modify(self, *args, **kwargs):
+        return super(BaseQuerySet, self._write_queryset()).modify(*args, **kwargs)
+
     @property
     def ordered(self):
         """
@@ -84,6 +323,9 @@ class BaseQuerySet(Generic[_M]):
         Return a tuple of (object, created), where created is a boolean
         specifying whether an object was created.
         """
+        result = self._upsert(defaults, kwargs, update=False)
+        if result is not None:
+            return result
         try:
             return self.get(**kwargs), False
         except self.model.DoesNotExist:
@@ -106,6 +348,9 @@ class BaseQuerySet(Generic[_M]):
         Return a tuple (object, created), where created is a boolean
         specifying whether an object was created.
         """
+        result = self._upsert(defaults, kwargs, update=True)
+        if result is not None:
+            return result
         defaults = defaults or {}
         self._for_write = True
         obj, created = self.get_or_create(defaults, **kwargs)
@@ -116,15 +361,226 @@ class BaseQuerySet(Generic[_M]):
         obj.save()
         return obj, False
 
+    def bulk_create(self, objs, batch_size=None, ordered=True):
+        """
+        Validates and inserts the given documents with ``insert_many``,
+        ``batch_size`` at a time (all at once by default), and sets their
+        primary keys.
+
+        ``save()`` is not called; only the bulk insert signals are sent.
+        Failed batches are listed in the raised BulkWriteError. With
+        ``ordered``, inserting stops at the first error.
+        """
+        objs = list(objs)
+        for obj in objs:
+            if not isinstance(obj, self._document):
+                raise OperationError(
+                    "Some documents inserted aren't instances of %s" % self._document
+                )
+            obj.validate()
+
+        collection = self._write_queryset()._collection
+        batch_errors = []
+        for number, batch in enumerate(_batches(objs, batch_size)):
+            signals.pre_bulk_insert.send(self._document, documents=batch)
+            raw = [obj.to_mongo() for obj in batch]
+            failed = set()
+            try:
+                collection.insert_many(raw, ordered=ordered)
+            except PyMongoBulkWriteError as e:
+                batch_errors.append((number, e.details))
+                failed = _failed_indexes(e.details, len(batch), ordered)
+
+            inserted = []
+            for i, (obj, son) in enumerate(zip(batch, raw)):
+                if i in failed:
+                    continue
+                obj.pk = son["_id"]
+                obj._clear_changed_fields()
+                obj._created = False
+                inserted.append(obj)
+            signals.post_bulk_insert.send(self._document, documents=inserted, loaded=True)
+            if batch_errors and ordered:
+                break
+
+        if batch_errors:
+            raise BulkWriteError(
+                "Bulk insert failed in %d batch(es)" % len(batch_errors), batch_errors
+            )
+        return objs
+
+    def bulk_update(self, objs, fields, batch_size=None):
+        """
+        Updates the given ``fields`` of the documents with ``bulk_write``,
+        one ``UpdateOne`` per document built from its changed fields,
+        ``batch_size`` documents at a time (all at once by default).
+        Documents without changes to these fields are skipped.
+
+        Returns the number of documents matched. Failed batches are listed
+        in the raised BulkWriteError.
+        """
+        if not fields:
+            raise ValueError("Field names must be given to bulk_update().")
+        document_fields = self._document._fields
+        try:
+            db_fields = {document_fields[name].db_field for name in fields}
+        except KeyError as e:
+            raise FieldDoesNotExist(
+                "%s has no field named %r" % (self._document.__name__, e.args[0])
+            )
+        id_field = document_fields[self._document._meta["id_field"]]
+
+        updates = []
+        for obj in objs:
+            if obj.pk is None:
+                raise ValueError("All bulk_update() objects must have a primary key set.")
+            set_data, unset_data = obj._delta()
+            update = {}
+            for operator, data in (("$set", set_data), ("$unset", unset_data)):
+                data = {key: value for key, value in data.items() if key.split(".")[0] in db_fields}
+                if data:
+                    update[operator] = data
+            if update:
+                # Changed fields can only be cleared if all of them are written.
+                complete = len(set_data) + len(unset_data) == sum(map(len, update.values()))
+                query = {"_id": id_field.to_mongo(obj.pk)}
+                updates.append((obj, complete, UpdateOne(query, update)))
+
+        collection = self._write_queryset()._collection
+        matched = 0
+        batch_errors = []
+        for number, batch in enumerate(_batches(updates, batch_size)):
+            failed = set()
+            try:
+                result = collection.bulk_write([op for _, _, op in batch], ordered=False)
+                matched += result.matched_count
+            except PyMongoBulkWriteError as e:
+                batch_errors.append((number, e.details))
+                matched += e.details.get("nMatched", 0)
+                failed = _failed_indexes(e.details, len(batch), False)
+            for i, (obj, complete, _op) in enumerate(batch):
+                if complete and i not in failed:
+                    obj._clear_changed_fields()
+
+        if batch_errors:
+            raise BulkWriteError(
+                "Bulk update failed in %d batch(es)" % len(batch_errors), batch_errors
+            )
+        return matched
+
+    def _can_upsert(self):
+        """
+        Returns True if get_or_create / update_or_create can skip
+        ``Document.save()``: the document doesn't override it and no save
+        signals are connected.
+        """
+        document = self._document
+        if document.save is not me.Document.save:
+            return False
+        if signals.signals_available:
+            for signal in (signals.pre_save, signals.pre_save_post_validation, signals.post_save):
+                if signal.has_receivers_for(document):
+                    return False
+        return not (self._where_clause or self._none or self._empty)
+
+    def _upsert(self, defaults, kwargs, update):
+        """
+        Runs get_or_create / update_or_create as a single findOneAndUpdate
+        upsert, with the new document in ``$setOnInsert`` and, for updates,
+        the defaults in ``$set``.
+
+        Returns (object, created), or None if the caller should fall back
+        to the get() / create() / save() path.
+        """
+        if not self._can_upsert():
+            return None
+
+        defaults = dict(resolve_callables(defaults or {}))
+        fields = self._document._fields
+        if update and any(name not in fields for name in defaults):
+            return None
+
+        try:
+            obj = self.model(**self._extract_model_params(defaults, **kwargs))
+        except FieldError:
+            return None
+        if obj.pk is None:
+            # The _id of an inserted document is not returned, so it has to
+            # be generated here.
+            if not isinstance(fields[self._document._meta["id_field"]], ObjectIdField):
+                return None
+            obj.pk = ObjectId()
+        try:
+            obj.validate()
+        except ValidationError:
+            return None
+
+        son = obj.to_mongo()
+        query = self.filter(**kwargs)._query
+        update_doc = {}
+        if update:
+            for name in defaults:
+                db_field = fields[name].db_field
+                if db_field in son:
+                    update_doc.setdefault("$set", {})[db_field] = son[db_field]
+                else:
+                    update_doc.setdefault("$unset", {})[db_field] = ""
+        on_insert = {
+            key: value
+            for key, value in son.items()
+            if query.get(key) != value
+            and key not in update_doc.get("$set", {})
+            and key not in update_doc.get("$unset", {})
+        }
+        if on_insert:
+            update_doc["$setOnInsert"] = on_insert
+        if not update_doc:
+            return None
+
+        try:
+            before = self._write_queryset()._collection.find_one_and_update(
+                query, update_doc, upsert=True, return_document=ReturnDocument.BEFORE
+            )
+        except OperationFailure:
+            # Lost a race with a concurrent insert, a unique index is violated
+            # (DuplicateKeyError), or the server rejected the update
+            # (WriteError); the save() path sorts out which one.
+            return None
+
+        if before is None:
+            obj._clear_changed_fields()
+            obj._created = False
+            return obj, True
+
+        obj = self._document._from_son(before)
+        if update:
+            for name, value in defaults.items():
+                setattr(obj, name, value)
+            obj._clear_changed_fields()
+        return obj, False
+
     _extract_model_params = DjangoQuerySet.__dict__["_extract_model_params"]
 
 
 class QuerySet(BaseQuerySet[_M], qs.QuerySet[_M]):
-    pass
+    def _populate_cache(self):
+        start = len(self._result_cache or ())
+        super()._populate_cache()
+        if self._related_fields is not None and len(self._result_cache) > start:
+            self._dereference_related(self._result_cache[start:])
+
+    def no_cache(self) -> QuerySetNoCache[_M]:
+        """Convert to a non-caching queryset"""
+        if self._result_cache is not None:
+            raise OperationError("QuerySet already cached")
+
+        return self._clone_into(QuerySetNoCache(self._document, self._collection))
 
 
 class QuerySetNoCache(BaseQuerySet[_M], qs.QuerySetNoCache[_M]):
-    pass
+    def cache(self) -> QuerySet[_M]:
+        """Convert to a caching queryset"""
+        return self._clone_into(QuerySet(self._document, self._collection))
 
 
 class QuerySetManager(Generic[_M], qs.QuerySetManager):
@@ -132,3 +588,8 @@ class QuerySetManager(Generic[_M], qs.QuerySetManager):
     if TYPE_CHECKING:
 
         def __get__(self, instance: object, cls: type[_M]) -> QuerySet[_M]: ...
+
+    else:
+
+        def __get__(self, instance, owner):
+            return router.route_queryset(super().__get__(instance, owner))
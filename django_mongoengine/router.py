@@ -0,0 +1,88 @@
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.utils.functional import cached_property
+from django.utils.module_loading import import_string
+from mongoengine.connection import DEFAULT_CONNECTION_NAME
+
+__all__ = ["DocumentRouter", "router"]
+
+
+class DocumentRouter:
+    """
+    Picks the connection alias and read preference of document queries,
+    like django's ``ConnectionRouter`` does for models.
+
+    Routers are listed in ``settings.MONGODB_ROUTERS`` and may define any of:
+
+    * ``db_for_read(document, **hints)`` - alias for queries.
+    * ``db_for_write(document, **hints)`` - alias for queryset writes
+      (``update()``, ``delete()``, ``modify()``, bulk writes, upserts).
+    * ``read_preference(document, **hints)`` - pymongo read preference
+      for queries.
+
+    The first router returning something other than ``None`` wins. Aliases
+    default to the document's ``db_alias``, read preferences to the one of
+    the connection.
+    """
+
+    def __init__(self, routers=None):
+        """
+        If routers is not specified, default to settings.MONGODB_ROUTERS.
+        """
+        self._routers = routers
+
+    @cached_property
+    def routers(self):
+        if self._routers is None:
+            self._routers = getattr(settings, "MONGODB_ROUTERS", [])
+        routers = []
+        for r in self._routers:
+            if isinstance(r, str):
+                router = import_string(r)()
+            else:
+                router = r
+            routers.append(router)
+        return routers
+
+    def _route(self, action, document, hints):
+        for router in self.routers:
+            method = getattr(router, action, None)
+            if method is not None:
+                chosen = method(document, **hints)
+                if chosen is not None:
+                    return chosen
+        return None
+
+    def db_for_read(self, document, **hints):
+        return self._route("db_for_read", document, hints) or document._meta.get(
+            "db_alias", DEFAULT_CONNECTION_NAME
+        )
+
+    def db_for_write(self, document, **hints):
+        return self._route("db_for_write", document, hints) or document._meta.get(
+            "db_alias", DEFAULT_CONNECTION_NAME
+        )
+
+    def read_preference(self, document, **hints):
+        return self._route("read_preference", document, hints)
+
+    def route_queryset(self, queryset, **hints):
+        """
+        Returns ``queryset.routed(**hints)`` if any routers are configured
+        and ``queryset`` supports routing, else ``queryset`` itself.
+        """
+        if self.routers and hasattr(queryset, "routed"):
+            return queryset.routed(**hints)
+        return queryset
+
+
+router = DocumentRouter()
+
+
+def reset_routers(*, setting, **kwargs):
+    if setting == "MONGODB_ROUTERS":
+        router.__dict__.pop("routers", None)
+        router._routers = None
+
+
+setting_changed.connect(reset_routers)
@@ -0,0 +1,318 @@
+import hashlib
+import logging
+import time
+import zlib
+from datetime import timedelta
+from datetime import timezone as dt_timezone
+
+import bson
+from bson import Binary, json_util
+from django.conf import settings
+from django.contrib.sessions.backends.base import CreateError, SessionBase
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.crypto import constant_time_compare, md5, salted_hmac
+from django.utils import timezone
+from mongoengine import fields
+from mongoengine.connection import DEFAULT_CONNECTION_NAME
+from mongoengine.document import Document
+from pymongo.errors import DuplicateKeyError
+
+MONGOENGINE_SESSION_DB_ALIAS = getattr(
+    settings, "MONGOENGINE_SESSION_DB_ALIAS", DEFAULT_CONNECTION_NAME
+)
+
+# a setting for the name of the collection used to store sessions
+MONGOENGINE_SESSION_COLLECTION = getattr(
+    settings, "MONGOENGINE_SESSION_COLLECTION", "django_session"
+)
+
+# a setting for whether session data is stored encoded or not
+MONGOENGINE_SESSION_DATA_ENCODE = getattr(settings, "MONGOENGINE_SESSION_DATA_ENCODE", True)
+
+# a setting for how many seconds the expiry date of an unchanged session may
+# move forward without writing it
+MONGOENGINE_SESSION_EXPIRY_GRANULARITY = getattr(
+    settings, "MONGOENGINE_SESSION_EXPIRY_GRANULARITY", 0
+)
+
+# a setting for whether session data is stored signed in BSON Binary instead
+# of a string; takes precedence over MONGOENGINE_SESSION_DATA_ENCODE
+MONGOENGINE_SESSION_DATA_BINARY = getattr(settings, "MONGOENGINE_SESSION_DATA_BINARY", False)
+
+# settings for how binary session data is compressed ("zlib", "zstd" or None),
+# and from which serialized size in bytes
+MONGOENGINE_SESSION_DATA_COMPRESSION = getattr(
+    settings, "MONGOENGINE_SESSION_DATA_COMPRESSION", "zlib"
+)
+MONGOENGINE_SESSION_DATA_COMPRESS_MIN_SIZE = getattr(
+    settings, "MONGOENGINE_SESSION_DATA_COMPRESS_MIN_SIZE", 1024
+)
+
+# settings for how many expired sessions clear_expired() deletes at once, and
+# how many seconds it sleeps between batches
+MONGOENGINE_SESSION_CLEAR_BATCH_SIZE = getattr(
+    settings, "MONGOENGINE_SESSION_CLEAR_BATCH_SIZE", 1000
+)
+MONGOENGINE_SESSION_CLEAR_SLEEP = getattr(settings, "MONGOENGINE_SESSION_CLEAR_SLEEP", 0)
+
+# Binary session data is a compression flag, the HMAC-SHA256 of the flag and
+# payload, then the (compressed) serialized session.
+_COMPRESSIONS = {None: 0, "zlib": 1, "zstd": 2}
+_MAC_SIZE = hashlib.sha256().digest_size
+
+
+def _compress(compression, data):
+    if compression == "zlib":
+        return zlib.compress(data)
+    try:
+        import zstandard
+    except ImportError:
+        raise ImproperlyConfigured("zstd session compression requires the zstandard package")
+    return zstandard.ZstdCompressor().compress(data)
+
+
+def _decompress(flag, data):
+    if flag == _COMPRESSIONS["zlib"]:
+        return zlib.decompress(data)
+    import zstandard
+
+    return zstandard.ZstdDecompressor().decompress(data)
+
+
+def _session_data_field():
+    if MONGOENGINE_SESSION_DATA_BINARY:
+        return fields.BinaryField()
+    return fields.StringField() if MONGOENGINE_SESSION_DATA_ENCODE else fields.DictField()
+
+
+class MongoSession(Document):
+    session_key = fields.StringField(primary_key=True, max_length=40)
+    session_data = _session_data_field()
+    expire_date = fields.DateTimeField()
+
+    meta = {
+        "collection": MONGOENGINE_SESSION_COLLECTION,
+        "db_alias": MONGOENGINE_SESSION_DB_ALIAS,
+        "allow_inheritance": False,
+        "indexes": [{"fields": ["expire_date"], "expireAfterSeconds": 0}],
+    }
+
+    def get_decoded(self):
+        return SessionStore()._decode_session_data({"session_data": self.session_data})
+
+
+class SessionStore(SessionBase):
+    """A MongoEngine-based session store for Django."""
+
+    # (digest of session_data, expire_date) as last loaded from or written
+    # to MongoDB.
+    _db_session = None
+
+    def _get_session_from_db(self):
+        """
+        Returns the raw ``session_data`` and ``expire_date`` of the session,
+        or None if it doesn't exist or has expired.
+        """
+        s = MongoSession._get_collection().find_one(
+            {"_id": self.session_key, "expire_date": {"$gt": timezone.now()}},
+            {"_id": 0, "session_data": 1, "expire_date": 1},
+        )
+        if s is None:
+            self._session_key = None
+        elif settings.USE_TZ and timezone.is_naive(s["expire_date"]):
+            # Unless the connection is tz_aware, pymongo returns naive UTC
+            # datetimes.
+            s["expire_date"] = s["expire_date"].replace(tzinfo=dt_timezone.utc)
+        return s
+
+    def _decode_session_data(self, s):
+        session_data = s.get("session_data")
+        # Sessions stored before the storage mode was switched are empty.
+        if MONGOENGINE_SESSION_DATA_BINARY:
+            if isinstance(session_data, bytes):
+                return self.decode_binary(session_data)
+        elif MONGOENGINE_SESSION_DATA_ENCODE:
+            if isinstance(session_data, str):
+                return self.decode(session_data)
+        elif isinstance(session_data, dict):
+            return session_data
+        return {}
+
+    @staticmethod
+    def _session_data_digest(session_data):
+        """
+        Returns a digest of stored ``session_data`` telling whether the
+        session changed, without keeping a copy of it. The timestamp and
+        signature of signed strings are left out, as they change with time.
+        """
+        if isinstance(session_data, bytes):
+            value = bytes(session_data)
+        elif isinstance(session_data, str):
+            value = session_data.rsplit(":", 2)[0].encode()
+        else:
+            value = bson.encode(session_data or {})
+        return md5(value, usedforsecurity=False).digest()
+
+    def _encode_session_data(self, data):
+        if MONGOENGINE_SESSION_DATA_BINARY:
+            return self.encode_binary(data)
+        elif MONGOENGINE_SESSION_DATA_ENCODE:
+            return self.encode(data)
+        else:
+            return data
+
+    def _binary_mac(self, value, secret=None):
+        return salted_hmac(self.key_salt, value, secret, algorithm="sha256").digest()
+
+    def encode_binary(self, session_dict):
+        """
+        Returns the session dictionary serialized, compressed if it is at
+        least ``MONGOENGINE_SESSION_DATA_COMPRESS_MIN_SIZE`` bytes long, and
+        signed, as BSON Binary.
+        """
+        payload = self.serializer().dumps(session_dict)
+        flag = _COMPRESSIONS[None]
+        compression = MONGOENGINE_SESSION_DATA_COMPRESSION
+        if compression and len(payload) >= MONGOENGINE_SESSION_DATA_COMPRESS_MIN_SIZE:
+            compressed = _compress(compression, payload)
+            if len(compressed) < len(payload):
+                flag, payload = _COMPRESSIONS[compression], compressed
+        value = bytes([flag]) + payload
+        return Binary(self._binary_mac(value) + value)
+
+    def decode_binary(self, session_data):
+        mac, value = bytes(session_data[:_MAC_SIZE]), bytes(session_data[_MAC_SIZE:])
+        secrets = [settings.SECRET_KEY, *getattr(settings, "SECRET_KEY_FALLBACKS", [])]
+        if not value or not any(
+            constant_time_compare(mac, self._binary_mac(value, secret)) for secret in secrets
+        ):
+            logger = logging.getLogger("django.security.SuspiciousSession")
+            logger.warning("Session data corrupted")
+            return {}
+        try:
+            payload = value[1:]
+            if value[0] != _COMPRESSIONS[None]:
+                payload = _decompress(value[0], payload)
+            return self.serializer().loads(payload)
+        except Exception:
+            # Same as decode(): unreadable data is an empty session.
+            return {}
+
+    def load(self):
+        s = self._get_session_from_db()
+        if not s:
+            return {}
+        self._db_session = (self._session_data_digest(s.get("session_data")), s["expire_date"])
+        return self._decode_session_data(s)
+
+    def exists(self, session_key):
+        return MongoSession._get_collection().find_one({"_id": session_key}, {"_id": 1}) is not None
+
+    def create(self):
+        while True:
+            self._session_key = self._get_new_session_key()
+            try:
+                self.save(must_create=True)
+            except CreateError:
+                continue
+            self.modified = True
+            return
+
+    def save(self, must_create=False):
+        """
+        Inserts the session if ``must_create``, else ``$set``s its expiry
+        date, and its data if it changed since it was loaded.
+
+        If the data didn't change and the expiry date moved forward by at
+        most ``MONGOENGINE_SESSION_EXPIRY_GRANULARITY`` seconds, nothing is
+        written.
+        """
+        if self.session_key is None:
+            return self.create()
+        session_data = self._encode_session_data(self._get_session(no_load=must_create))
+        digest = self._session_data_digest(session_data)
+        expire_date = self.get_expiry_date()
+        collection = MongoSession._get_collection()
+        if must_create:
+            try:
+                collection.insert_one(
+                    {
+                        "_id": self.session_key,
+                        "session_data": session_data,
+                        "expire_date": expire_date,
+                    }
+                )
+            except DuplicateKeyError:
+                raise CreateError
+        elif self._db_session is not None and digest == self._db_session[0]:
+            moved = expire_date - self._db_session[1]
+            granularity = timedelta(seconds=MONGOENGINE_SESSION_EXPIRY_GRANULARITY)
+            if timedelta(0) <= moved <= granularity:
+                return
+            # The session may have expired since it was loaded, so the data
+            # is still needed if it gets inserted.
+            collection.update_one(
+                {"_id": self.session_key},
+                {
+                    "$set": {"expire_date": expire_date},
+                    "$setOnInsert": {"session_data": session_data},
+                },
+                upsert=True,
+            )
+        else:
+            collection.update_one(
+                {"_id": self.session_key},
+                {
+                    "$set": {
+                        "session_data": session_data,
+                        "expire_date": expire_date,
+                    }
+                },
+                upsert=True,
+            )
+        self._db_session = (digest, expire_date)
+
+    def delete(self, session_key=None):
+        if session_key is None:
+            if self.session_key is None:
+                return
+            session_key = self.session_key
+        MongoSession.objects(session_key=session_key).delete()
+
+    @classmethod
+    def clear_expired(cls):
+        """
+        Deletes expired sessions, oldest first, in ``delete_many`` runs over
+        ranges of ``MONGOENGINE_SESSION_CLEAR_BATCH_SIZE`` expiry dates, and
+        sleeps ``MONGOENGINE_SESSION_CLEAR_SLEEP`` seconds between runs.
+        Complements the TTL index when its monitor falls behind.
+        """
+        collection = MongoSession._get_collection()
+        expired = {"expire_date": {"$lt": timezone.now()}}
+        while True:
+            # The expiry date ending this batch, read from the index only.
+            bound = next(
+                collection.find(expired, {"_id": 0, "expire_date": 1})
+                .sort("expire_date", 1)
+                .skip(MONGOENGINE_SESSION_CLEAR_BATCH_SIZE - 1)
+                .limit(1),
+                None,
+            )
+            if bound is None:
+                collection.delete_many(expired)
+                return
+            collection.delete_many({"expire_date": {"$lte": bound["expire_date"]}})
+            if MONGOENGINE_SESSION_CLEAR_SLEEP:
+                time.sleep(MONGOENGINE_SESSION_CLEAR_SLEEP)
+
+
+class BSONSerializer:
+    """
+    Serializer that can handle BSON types (eg ObjectId).
+    """
+
+    def dumps(self, obj):
+        return json_util.dumps(obj, separators=(",", ":")).encode("ascii")
+
+    def loads(self, data):
+        return json_util.loads(data.decode("ascii"))
@@ -0,0 +1,92 @@
+"""
+Cached, MongoDB-backed sessions.
+"""
+
+from django.conf import settings
+from django.core.cache import caches
+
+from . import SessionStore as MongoStore
+
+KEY_PREFIX = "django_mongoengine.sessions.cached_db"
+
+
+class SessionStore(MongoStore):
+    """
+    Sessions read from the django cache first, and written through to
+    MongoDB on ``save()``.
+    """
+
+    cache_key_prefix = KEY_PREFIX
+
+    def __init__(self, session_key=None):
+        self._cache = caches[settings.SESSION_CACHE_ALIAS]
+        super().__init__(session_key)
+
+    @property
+    def cache_key(self):
+        return self.cache_key_prefix + self._get_or_create_session_key()
+
+    def load(self):
+        try:
+            cached = self._cache.get(self.cache_key)
+        except Exception:
+            # Some backends (e.g. memcache) raise an exception on invalid
+            # cache keys. If this happens, reset the session.
+            cached = None
+
+        if isinstance(cached, tuple):
+            # The stored digest and expiry date are cached with the data, so
+            # save() can still skip writing an unchanged session.
+            data, *db_session = cached
+            self._db_session = tuple(db_session)
+        elif cached is not None:
+            # Cached without its expiry date by an earlier version.
+            data = cached
+        else:
+            s = self._get_session_from_db()
+            if s:
+                data = self._decode_session_data(s)
+                self._db_session = (
+                    self._session_data_digest(s.get("session_data")),
+                    s["expire_date"],
+                )
+                self._set_cache(data)
+            else:
+                data = {}
+        return data
+
+    def _set_cache(self, data):
+        digest, expire_date = self._db_session
+        self._cache.set(
+            self.cache_key, (data, digest, expire_date), self.get_expiry_age(expiry=expire_date)
+        )
+
+    def exists(self, session_key):
+        return bool(
+            session_key
+            and (self.cache_key_prefix + session_key) in self._cache
+            or super().exists(session_key)
+        )
+
+    def save(self, must_create=False):
+        super().save(must_create)
+        # With the expiry date stored in MongoDB, which an unchanged session
+        # may not have moved forward.
+        self._set_cache(self._session)
+
+    def delete(self, session_key=None):
+        super().delete(session_key)
+        if session_key is None:
+            if self.session_key is None:
+                return
+            session_key = self.session_key
+        self._cache.delete(self.cache_key_prefix + session_key)
+
+    def flush(self):
+        """
+        Removes the current session data from the database and regenerates
+        the key.
+        """
+        self.clear()
+        self.delete(self.session_key)
+        self._session_key = None
@@ -0,0 +1,25 @@
+import importlib
+import sys
+
+
+def lazy_module_attrs(module_name: str, lazy_imports: dict):
+    """
+    Returns the ``__getattr__`` and ``__dir__`` functions of module
+    ``module_name``, which import each name of ``lazy_imports`` from the
+    (relative) module it maps to on first access.
+    """
+    module_globals = sys.modules[module_name].__dict__
+
+    def __getattr__(name):
+        try:
+            module = lazy_imports[name]
+        except KeyError:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}") from None
+        value = getattr(importlib.import_module(module, module_name), name)
+        module_globals[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(module_globals) | set(lazy_imports))
+
+    return __getattr__, __dir__
@@ -1,13 +1,68 @@
+import functools
 import importlib
 import importlib.util
-from types import MethodType
+from types import CodeType, FunctionType, MethodType
 
 from mongoengine.queryset import QuerySet, QuerySetNoCache
 
 from django_mongoengine.fields.djangoflavor import DjangoField
 
 
+def _reads_globals(code: CodeType, names) -> bool:
+    if not names.isdisjoint(code.co_names):
+        return True
+    return any(
+        isinstance(const, CodeType) and _reads_globals(const, names) for const in code.co_consts
+    )
+
+
+def patch_function_globals(func: FunctionType, **kwargs) -> FunctionType:
+    """
+    Returns a copy of ``func`` which sees ``kwargs`` instead of the globals
+    of its module, or ``func`` itself if it doesn't read any of them.
+    """
+    if not _reads_globals(func.__code__, set(kwargs)):
+        return func
+    patched = FunctionType(
+        func.__code__,
+        {**func.__globals__, **kwargs},
+        func.__name__,
+        func.__defaults__,
+        func.__closure__,
+    )
+    patched.__kwdefaults__ = func.__kwdefaults__
+    patched.__qualname__ = func.__qualname__
+    patched.__doc__ = func.__doc__
+    patched.__dict__.update(func.__dict__)
+    return patched
+
+
+def get_patched_django_class(cls: type, **kwargs) -> type:
+    """
+    Returns a subclass of ``cls`` with the same attributes, except that the
+    methods reading one of the module globals in ``kwargs`` see the given
+    values instead.
+
+    Unlike ``get_patched_django_module`` nothing is executed again, and
+    ``cls`` stays the base class of the patched one.
+    """
+    attrs = {}
+    for k, v in cls.__dict__.items():
+        if k in ("__dict__", "__weakref__"):
+            continue
+        if isinstance(v, FunctionType):
+            v = patch_function_globals(v, **kwargs)
+        attrs[k] = v
+    return type(cls)(cls.__name__, (cls,), attrs)
+
+
+@functools.lru_cache(maxsize=None)
 def get_patched_django_module(modname: str, **kwargs):
+    """
+    Returns a copy of module ``modname`` with the globals in ``kwargs``
+    replaced. The module is executed again, once per set of arguments;
+    prefer ``get_patched_django_class`` which doesn't.
+    """
     # Patch module in-place
     # https://docs.python.org/3/library/importlib.html#importlib-examples
     mod = importlib.import_module(modname)
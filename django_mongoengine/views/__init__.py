@@ -1,7 +1,12 @@
-from .detail import DetailView
-from .edit import CreateView, DeleteView, UpdateView
-from .embedded import EmbeddedDetailView
-from .list import ListView
+from typing import TYPE_CHECKING
+
+from django_mongoengine.utils.lazy import lazy_module_attrs
+
+if TYPE_CHECKING:
+    from .detail import DetailView
+    from .edit import CreateView, DeleteView, UpdateView
+    from .embedded import EmbeddedDetailView
+    from .list import ListView
 
 __all__ = [
     "ListView",
@@ -11,3 +16,14 @@ __all__ = [
     "UpdateView",
     "DeleteView",
 ]
+
+_LAZY_IMPORTS = {
+    "ListView": ".list",
+    "DetailView": ".detail",
+    "EmbeddedDetailView": ".embedded",
+    "CreateView": ".edit",
+    "UpdateView": ".edit",
+    "DeleteView": ".edit",
+}
+
+__getattr__, __dir__ = lazy_module_attrs(__name__, _LAZY_IMPORTS)
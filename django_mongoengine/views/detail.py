@@ -2,12 +2,16 @@ from django.core.exceptions import ImproperlyConfigured
 from django.views.generic import detail as djmod
 from django.views.generic.base import TemplateResponseMixin, View
 
+from django_mongoengine.router import router
 from django_mongoengine.utils.wrappers import WrapDocument, copy_class
 
 
 class SingleObjectMixin(djmod.SingleObjectMixin, metaclass=WrapDocument):
     document = None
 
+    def get_queryset(self):
+        return router.route_queryset(super().get_queryset(), view=self, request=self.request)
+
     def get_context_object_name(self, obj):
         """
         Get the name to use for the object.
@@ -1,17 +1,17 @@
+from types import SimpleNamespace
+
 from django.core.exceptions import ImproperlyConfigured
+from django.views.generic import edit as djmod
 
 from django_mongoengine.forms.documents import documentform_factory
-from django_mongoengine.utils.monkey import get_patched_django_module
+from django_mongoengine.utils.monkey import patch_function_globals
 from django_mongoengine.utils.wrappers import WrapDocument, copy_class
 
 from .detail import SingleObjectMixin, SingleObjectTemplateResponseMixin
 
-djmod = get_patched_django_module(
-    "django.views.generic.edit",
-    model_forms=get_patched_django_module(
-        "django.forms.models",
-        modelform_factory=documentform_factory,
-    ),
+_get_form_class = patch_function_globals(
+    djmod.ModelFormMixin.get_form_class,
+    model_forms=SimpleNamespace(modelform_factory=documentform_factory),
 )
 
 try:
@@ -51,6 +51,7 @@ class CreateView(
     metaclass=WrapDocumentForm,
 ):
     __doc__ = djmod.CreateView.__doc__
+    get_form_class = _get_form_class
 
 
 @copy_class(djmod.UpdateView)
@@ -61,6 +62,7 @@ class UpdateView(
     metaclass=WrapDocumentForm,
 ):
     __doc__ = djmod.UpdateView.__doc__
+    get_form_class = _get_form_class
 
 
 @copy_class(djmod.DeleteView)
@@ -1,7 +1,13 @@
+from django.core.paginator import InvalidPage
+from django.http import Http404
+from django.utils.translation import gettext as _
+from django.views.generic import list as djmod
 from mongoengine.queryset import QuerySet
 
-from django_mongoengine.paginator import Paginator
-from django_mongoengine.utils.monkey import get_patched_django_module
+from django_mongoengine.paginator import KeysetPaginator, Paginator
+from django_mongoengine.queryset import BaseQuerySet, reference_fields
+from django_mongoengine.router import router
+from django_mongoengine.utils.monkey import get_patched_django_class
 from django_mongoengine.utils.wrappers import WrapDocument, copy_class
 
 __all__ = [
@@ -9,14 +15,49 @@ __all__ = [
     "ListView",
 ]
 
-djmod = get_patched_django_module(
-    "django.views.generic.list",
-    QuerySet=QuerySet,
-)
 
-
-class MultipleObjectMixin(djmod.MultipleObjectMixin, metaclass=WrapDocument):
+class MultipleObjectMixin(
+    get_patched_django_class(djmod.MultipleObjectMixin, QuerySet=QuerySet),
+    metaclass=WrapDocument,
+):
     paginator_class = Paginator
+    # Reference fields dereferenced in one query per field for each page:
+    # True for all of them, or a list of names.
+    list_select_related = False
+
+    def get_queryset(self):
+        queryset = router.route_queryset(super().get_queryset(), view=self, request=self.request)
+        if isinstance(queryset, BaseQuerySet) and self.list_select_related:
+            if self.list_select_related is True:
+                fields = reference_fields(queryset._document)
+            else:
+                fields = self.list_select_related
+            queryset = queryset.prefetch_related(*fields)
+        return queryset
+
+    def paginate_queryset(self, queryset, page_size):
+        """
+        Paginate the queryset, if needed.
+
+        With a ``KeysetPaginator`` the ``page_kwarg`` holds an opaque cursor
+        instead of a page number.
+        """
+        if not issubclass(self.paginator_class, KeysetPaginator):
+            return super().paginate_queryset(queryset, page_size)
+
+        paginator = self.get_paginator(
+            queryset,
+            page_size,
+            orphans=self.get_paginate_orphans(),
+            allow_empty_first_page=self.get_allow_empty(),
+        )
+        page_kwarg = self.page_kwarg
+        cursor = self.kwargs.get(page_kwarg) or self.request.GET.get(page_kwarg)
+        try:
+            page = paginator.page(cursor)
+            return (paginator, page, page.object_list, page.has_other_pages())
+        except InvalidPage as e:
+            raise Http404(_("Invalid page: %(message)s") % {"message": str(e)})
 
 
 class MultipleObjectTemplateResponseMixin(
@@ -27,6 +68,6 @@ class MultipleObjectTemplateResponseMixin(
 
 
 @copy_class(djmod.ListView)
-class ListView(MultipleObjectTemplateResponseMixin, djmod.BaseListView):
+class ListView(MultipleObjectTemplateResponseMixin, MultipleObjectMixin, djmod.BaseListView):
     __doc__ = djmod.ListView.__doc__
     paginator_class = Paginator
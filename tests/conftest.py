@@ -0,0 +1,13 @@
+import pytest
+
+from .views.models import City
+
+
+@pytest.fixture
+def make_cities():
+    def make_cities(n):
+        City.drop_collection()
+        for i in range(n):
+            City.objects.create(name="City %02i" % i)
+
+    return make_cities
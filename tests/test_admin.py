@@ -0,0 +1,187 @@
+from functools import partial
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from django.contrib.auth.models import AnonymousUser
+from django.test import RequestFactory
+from django.urls import path
+
+from django_mongoengine.mongo_admin import DocumentAdmin
+from django_mongoengine.mongo_admin.sites import AdminSite
+from django_mongoengine.mongo_admin.views import CURSOR_VAR
+from django_mongoengine.paginator import KeysetPaginator, Paginator
+from django_mongoengine.queryset import QuerySet
+
+from .views.models import Book, City
+
+
+class Superuser(AnonymousUser):
+    is_active = is_staff = is_superuser = True
+
+    def has_perm(self, perm, obj=None):
+        return True
+
+
+def get_changelist(admin_class, query=None, model=City):
+    request = RequestFactory().get("/", query or {})
+    request.user = Superuser()
+    return admin_class(model, AdminSite()).get_changelist_instance(request)
+
+
+# Filled by the admin_site fixture.
+urlpatterns = []
+
+
+@pytest.fixture
+def admin_site(settings):
+    """
+    Returns a function registering an admin class for City on a site
+    served by the test urlconf, which renders changelists.
+    """
+    settings.INSTALLED_APPS = [
+        *settings.INSTALLED_APPS,
+        "django.contrib.admin.apps.SimpleAdminConfig",
+        "django_mongoengine.mongo_admin.apps.SimpleMongoAdminConfig",
+    ]
+
+    def register(admin_class):
+        site = AdminSite()
+        site.register(City, admin_class)
+        urlpatterns[:] = [path("admin/", site.urls)]
+        settings.ROOT_URLCONF = __name__
+        return site._registry[City]
+
+    return register
+
+
+def render_changelist(model_admin, query=None):
+    request = RequestFactory().get("/admin/views/city/", query or {})
+    request.user = Superuser()
+    return model_admin.changelist_view(request).render().content.decode()
+
+
+class KeysetCityAdmin(DocumentAdmin):
+    paginator = KeysetPaginator
+    list_per_page = 5
+    ordering = ["name"]
+
+
+def test_keyset_changelist(make_cities, admin_site):
+    make_cities(8)
+    cl = get_changelist(KeysetCityAdmin)
+    assert [c.name for c in cl.result_list] == ["City %02i" % i for i in range(5)]
+    assert cl.previous_page_url is None
+    html = render_changelist(admin_site(KeysetCityAdmin))
+    assert 'href="%s"' % cl.next_page_url.replace("&", "&amp;") in html
+
+    cursor = parse_qs(urlparse(cl.next_page_url).query)[CURSOR_VAR][0]
+    cl = get_changelist(KeysetCityAdmin, {CURSOR_VAR: cursor})
+    assert [c.name for c in cl.result_list] == ["City %02i" % i for i in range(5, 8)]
+    assert cl.next_page_url is None
+    assert cl.previous_page_url is not None
+
+    # Sorting and filtering links drop the cursor.
+    assert CURSOR_VAR not in cl.get_query_string({"o": "1"})
+
+
+class CountingCityAdmin(DocumentAdmin):
+    list_per_page = 5
+    search_fields = ["name"]
+    paginators = []
+
+    def get_paginator(self, *args, **kwargs):
+        paginator = super().get_paginator(*args, **kwargs)
+        self.paginators.append(paginator)
+        return paginator
+
+
+def test_changelist_counts(make_cities):
+    make_cities(8)
+    CountingCityAdmin.paginators = []
+    cl = get_changelist(CountingCityAdmin)
+    assert (cl.result_count, cl.full_result_count) == (8, 8)
+    # Without filters the paginator count is reused for the full count.
+    assert len(CountingCityAdmin.paginators) == 1
+
+    CountingCityAdmin.paginators = []
+    cl = get_changelist(CountingCityAdmin, {"q": "City 0"})
+    assert (cl.result_count, cl.full_result_count) == (8, 8)
+    assert len(CountingCityAdmin.paginators) == 2
+
+
+def test_changelist_no_full_result_count(make_cities):
+    make_cities(8)
+
+    class CityAdmin(CountingCityAdmin):
+        show_full_result_count = False
+        paginators = []
+
+    cl = get_changelist(CityAdmin, {"q": "City 01"})
+    assert (cl.result_count, cl.full_result_count) == (1, None)
+    assert cl.show_admin_actions
+    assert len(CityAdmin.paginators) == 1
+
+
+def test_changelist_facet_counts(make_cities, monkeypatch):
+    make_cities(8)
+
+    class CityAdmin(CountingCityAdmin):
+        facet_result_counts = True
+        paginators = []
+
+    aggregate = QuerySet.aggregate
+    pipelines = []
+
+    def record_aggregate(self, pipeline, *args, **kwargs):
+        pipelines.append(pipeline)
+        return aggregate(self, pipeline, *args, **kwargs)
+
+    monkeypatch.setattr(QuerySet, "aggregate", record_aggregate)
+    cl = get_changelist(CityAdmin, {"q": "City 01"})
+    assert (cl.result_count, cl.full_result_count) == (1, 8)
+    assert len(pipelines) == 1
+    assert len(CityAdmin.paginators) == 1
+
+    # Capped paginators count by themselves.
+    class CappedCityAdmin(CityAdmin):
+        paginator = partial(Paginator, max_count=5)
+
+    pipelines.clear()
+    cl = get_changelist(CappedCityAdmin, {"q": "City"})
+    assert (cl.result_count, cl.full_result_count) == (5, 5)
+    assert cl.result_count_is_capped
+    assert not pipelines
+
+
+def test_changelist_prefetch_related():
+    class BookAdmin(DocumentAdmin):
+        list_display = ["name", "authors"]
+
+    cl = get_changelist(BookAdmin, model=Book)
+    assert cl.queryset._prefetch_related_lookups == ["authors"]
+
+    BookAdmin.list_display = ["name"]
+    assert get_changelist(BookAdmin, model=Book).queryset._prefetch_related_lookups == []
+
+
+def test_capped_changelist(make_cities, admin_site):
+    make_cities(12)
+
+    class CappedCityAdmin(DocumentAdmin):
+        paginator = partial(Paginator, max_count=5)
+        list_display = ["name"]
+        list_per_page = 2
+        ordering = ["name"]
+
+    model_admin = admin_site(CappedCityAdmin)
+    html = render_changelist(model_admin)
+    assert "More than 5 Citys" in html
+    assert 'href="?p=3"' in html
+    # Pages past the capped count are linked and can be shown.
+    html = render_changelist(model_admin, {"p": "3"})
+    assert 'href="?p=4"' in html
+    html = render_changelist(model_admin, {"p": "4"})
+    assert "City 06" in html and 'href="?p=5"' in html
+    html = render_changelist(model_admin, {"p": "6"})
+    assert "City 11" in html and 'href="?p=7"' not in html
@@ -0,0 +1,228 @@
+import pytest
+from django.core.cache import cache
+from django.test import override_settings
+from mongoengine import signals
+
+from django_mongoengine import fields
+from django_mongoengine.mongo_auth import backends
+from django_mongoengine.mongo_auth.backends import MongoEngineBackend, connect_user_cache_signals
+from django_mongoengine.mongo_auth.managers import get_user_document
+from django_mongoengine.mongo_auth.models import ContentType, Group, Permission, User
+
+from .views.models import City
+
+
+class GroupUser(User):
+    groups = fields.ListField(fields.ReferenceField(Group))
+
+
+@pytest.fixture
+def permissions():
+    for document in (User, Group, Permission, ContentType):
+        document.drop_collection()
+    city = ContentType.objects.create(name="city", app_label="views", model="city")
+    author = ContentType.objects.create(name="author", app_label="books", model="author")
+    return {
+        codename: Permission.objects.create(name=codename, codename=codename, content_type=ct)
+        for codename, ct in [
+            ("view_city", city),
+            ("change_city", city),
+            ("view_author", author),
+        ]
+    }
+
+
+MONGOENGINE_BACKEND = "django_mongoengine.mongo_auth.backends.MongoEngineBackend"
+
+
+class DenyAllBackend:
+    def has_perm(self, user_obj, perm, obj=None):
+        return False
+
+    def has_module_perms(self, user_obj, app_label):
+        return False
+
+    def get_all_permissions(self, user_obj, obj=None):
+        return set()
+
+
+@override_settings(AUTHENTICATION_BACKENDS=[MONGOENGINE_BACKEND])
+def test_permissions(permissions):
+    group = Group.objects.create(name="editors", permissions=[permissions["change_city"]])
+    user = GroupUser(
+        username="user",
+        email="user@example.com",
+        password="-",
+        user_permissions=[permissions["view_city"], permissions["view_author"]],
+        groups=[group],
+    ).save()
+
+    user = GroupUser.objects.get(pk=user.pk)
+    assert user._get_permissions("user") == {"views.view_city", "books.view_author"}
+    assert user._get_permissions("group") == {"views.change_city"}
+    assert user.get_all_permissions() == {
+        "views.view_city",
+        "views.change_city",
+        "books.view_author",
+    }
+
+    # Permissions are cached on the instance.
+    Permission.drop_collection()
+    assert user.has_perms(["views.view_city", "views.change_city"])
+    assert not user.has_perm("views.delete_city")
+    assert user.has_module_perms("books")
+    assert not user.has_module_perms("auth")
+
+
+@override_settings(AUTHENTICATION_BACKENDS=["tests.test_auth.DenyAllBackend"])
+def test_permissions_from_backends(permissions):
+    user = User(
+        username="user",
+        email="user@example.com",
+        password="-",
+        user_permissions=[permissions["view_city"]],
+    ).save()
+    assert not user.has_perm("views.view_city")
+    assert not user.has_module_perms("views")
+    assert user.get_all_permissions() == set()
+
+
+@override_settings(AUTHENTICATION_BACKENDS=[MONGOENGINE_BACKEND])
+def test_permissions_inactive(permissions):
+    user = User(
+        username="user",
+        email="user@example.com",
+        password="-",
+        is_active=False,
+        user_permissions=[permissions["view_city"]],
+    ).save()
+    assert not user.has_perm("views.view_city")
+    assert User(username="new")._get_permissions() == set()
+
+
+def test_backend_permissions(permissions):
+    group = Group.objects.create(name="editors", permissions=[permissions["change_city"]])
+    user = GroupUser(
+        username="user",
+        email="user@example.com",
+        password="-",
+        user_permissions=[permissions["view_city"]],
+        groups=[group],
+    ).save()
+    backend = MongoEngineBackend()
+
+    assert backend.get_user_permissions(user) == {"views.view_city"}
+    assert backend.get_group_permissions(user) == {"views.change_city"}
+    assert backend.get_all_permissions(user) == {"views.view_city", "views.change_city"}
+    assert backend.get_all_permissions(user, obj=user) == set()
+    assert backend.has_perm(user, "views.change_city")
+    assert not backend.has_perm(user, "books.view_author")
+    assert backend.has_module_perms(user, "views")
+    assert not backend.has_module_perms(user, "books")
+
+    user.is_active = False
+    assert not backend.has_perm(user, "views.change_city")
+
+
+def test_backend_superuser_permissions(permissions):
+    user = User(
+        username="admin",
+        email="admin@example.com",
+        password="-",
+        is_superuser=True,
+        user_permissions=[permissions["view_city"]],
+    ).save()
+    backend = MongoEngineBackend()
+    all_permissions = {"views.view_city", "views.change_city", "books.view_author"}
+
+    assert backend.get_all_permissions(user) == all_permissions
+    assert backend.get_user_permissions(user) == all_permissions
+    assert backend.has_perm(user, "books.view_author")
+    assert not backend.has_perm(user, "books.delete_author")
+    assert backend.has_module_perms(user, "books")
+
+    user.is_active = False
+    assert backend.get_all_permissions(user) == set()
+
+
+@pytest.fixture
+def user_cache_signals():
+    """
+    Disconnects the user cache receivers connected by the test.
+    """
+    yield
+    for sender in backends._cache_signal_senders:
+        signals.post_save.disconnect(backends.invalidate_cached_user, sender=sender)
+        signals.post_delete.disconnect(backends.invalidate_cached_user, sender=sender)
+    backends._cache_signal_senders.clear()
+
+
+@override_settings(MONGOENGINE_USER_CACHE_TIMEOUT=60)
+def test_backend_get_user_cached(monkeypatch, user_cache_signals):
+    User.drop_collection()
+    cache.clear()
+    user = User(username="user", email="user@example.com", password="-").save()
+    fetched = []
+
+    def get_user(self, user_id):
+        fetched.append(user_id)
+        return User.objects.get(pk=user_id)
+
+    monkeypatch.setattr(MongoEngineBackend, "_get_user", get_user)
+    backend = MongoEngineBackend()
+    user_id = str(user.pk)
+
+    assert backend.get_user(user_id) == user
+    cached = backend.get_user(user_id)
+    assert cached == user
+    assert cached.username == "user"
+    assert len(fetched) == 1
+
+    user.username = "renamed"
+    user.save()
+    assert backend.get_user(user_id).username == "renamed"
+    assert len(fetched) == 2
+
+    user.delete()
+    with pytest.raises(User.DoesNotExist):
+        backend.get_user(user_id)
+
+
+def test_backend_keeps_upserts(user_cache_signals):
+    with override_settings(MONGOENGINE_USER_CACHE_TIMEOUT=60):
+        connect_user_cache_signals()
+    assert City.objects._can_upsert()
+    assert not User.objects._can_upsert()
+
+
+def test_get_user_document():
+    assert get_user_document() is User
+    with override_settings(MONGOENGINE_USER_DOCUMENT="tests.test_auth.GroupUser"):
+        assert get_user_document() is GroupUser
+    assert get_user_document() is User
+
+
+def test_content_type_cache(permissions):
+    ContentType.objects.clear_cache()
+    city = ContentType.objects.get_by_natural_key("views", "city")
+    assert ContentType.objects.get_for_id(str(city.pk)) is city
+    assert ContentType.objects.get_for_model(City) is city
+    permission = Permission.objects.get(codename="view_city")
+
+    # Served from the cache.
+    ContentType.objects.update(set__name="changed")
+    assert ContentType.objects.get_by_natural_key("views", "city").name == "city"
+    assert str(permission) == "views | city | view_city"
+    assert permission.natural_key() == ("view_city", "views", "city")
+
+    # Saving a content type clears the cache.
+    city.reload()
+    city.save()
+    assert ContentType.objects.get_by_natural_key("views", "city").name == "changed"
+
+    group_user = ContentType.objects.get_for_model(GroupUser)
+    assert (group_user.app_label, group_user.model) == ("tests", "groupuser")
+    assert ContentType.objects.get_for_models(GroupUser, City) == {
+        GroupUser: group_user,
+        City: city,
+    }
@@ -0,0 +1,138 @@
+import logging
+import os
+import threading
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from mongoengine import connection
+
+from django_mongoengine import connection as mongo_connection
+from django_mongoengine.connection import (
+    reset_connections,
+    validate_connection_settings,
+    warmup,
+    warmup_connection,
+)
+
+from .views.models import City
+
+
+def test_validate_connection_settings():
+    validate_connection_settings("default", {"name": "db", "maxPoolSize": 10, "minPoolSize": 2})
+    validate_connection_settings("default", {"name": "db", "serverSelectionTimeoutMS": 500})
+    validate_connection_settings("default", {"name": "db", "maxPoolSize": 10, "minPoolSize": None})
+
+
+@pytest.mark.parametrize(
+    "conn_settings",
+    [
+        {"maxPoolSize": -1},
+        {"minpoolsize": "2"},
+        {"minPoolSize": 5, "maxPoolSize": 2},
+        {"connectTimeoutMS": -10},
+        {"maxPoolSize": True},
+        {"socketTimeoutMS": False},
+    ],
+)
+def test_validate_connection_settings_invalid(conn_settings):
+    with pytest.raises(ImproperlyConfigured):
+        validate_connection_settings("default", dict(conn_settings, name="db"))
+
+
+class PingClient:
+    def __init__(self):
+        self.pings = 0
+        self.admin = self
+
+    def command(self, name):
+        assert name == "ping"
+        self.pings += 1
+
+
+def test_warmup_connection(monkeypatch):
+    client = PingClient()
+    monkeypatch.setattr(connection, "get_connection", lambda alias: client)
+    warmup_connection("default", {"name": "db"})
+    assert client.pings == 1
+    # One more ping per connection of the minimum pool.
+    warmup_connection("default", {"name": "db", "minPoolSize": 4})
+    assert client.pings == 6
+
+
+def test_warmup_databases(caplog):
+    from django.conf import settings
+
+    with caplog.at_level(logging.WARNING, logger="django_mongoengine"):
+        warmup(settings.MONGODB_DATABASES, timeout=30, indexes=True)
+    assert not caplog.records
+    assert set(settings.MONGODB_DATABASES) <= set(connection._connections)
+
+
+@pytest.fixture
+def warmup_calls(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        mongo_connection, "warmup_connection", lambda alias, conn_settings: calls.append(alias)
+    )
+    monkeypatch.setattr(mongo_connection, "ensure_indexes", lambda: calls.append("indexes"))
+    return calls
+
+
+def test_warmup(warmup_calls, caplog):
+    warmup({"default": {}, "other": {}}, timeout=30, indexes=True)
+    assert sorted(warmup_calls) == ["default", "indexes", "other"]
+    assert not caplog.records
+
+    warmup_calls.clear()
+    warmup({"default": {}}, timeout=30)
+    assert warmup_calls == ["default"]
+
+
+def test_warmup_failed(warmup_calls, monkeypatch, caplog):
+    def fail(alias, conn_settings):
+        raise ConnectionError(alias)
+
+    monkeypatch.setattr(mongo_connection, "warmup_connection", fail)
+    with caplog.at_level(logging.WARNING, logger="django_mongoengine"):
+        warmup({"default": {}}, indexes=True)
+    assert caplog.messages == ["MongoDB warmup of 'default' failed"]
+    assert warmup_calls == []
+
+
+def test_warmup_timeout(warmup_calls, monkeypatch, caplog):
+    connected = threading.Event()
+    monkeypatch.setattr(
+        mongo_connection, "warmup_connection", lambda alias, conn_settings: connected.wait(5)
+    )
+    try:
+        with caplog.at_level(logging.WARNING, logger="django_mongoengine"):
+            warmup({"default": {}}, timeout=0.01, indexes=True)
+    finally:
+        connected.set()
+    assert caplog.messages == ["MongoDB warmup of 'default' did not finish in 0.01s"]
+    assert warmup_calls == []
+
+
+def test_reset_connections():
+    alias = connection.DEFAULT_CONNECTION_NAME
+    client = connection.get_connection()
+    City.objects.first()
+    db = connection._dbs[alias]
+    try:
+        reset_connections([alias])
+        assert City._collection is None
+        assert connection.get_connection() is not client
+    finally:
+        connection._connections[alias] = client
+        connection._dbs[alias] = db
+        City._collection = None
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+def test_connections_reset_after_fork():
+    client = connection.get_connection()
+    pid = os.fork()
+    if pid == 0:
+        os._exit(0 if connection.get_connection() is not client else 1)
+    _pid, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
@@ -1,8 +1,61 @@
+import pytest
+from django.core.exceptions import FieldDoesNotExist
+
+from django_mongoengine import Document, EmbeddedDocument, fields
 from django_mongoengine.fields import ObjectIdField
 
 from .views.models import City
 
 
+class Address(EmbeddedDocument):
+    street = fields.StringField(db_field="s")
+
+
+class Office(Document):
+    city = fields.ReferenceField(City)
+    address = fields.EmbeddedDocumentField(Address)
+    branches = fields.ListField(fields.EmbeddedDocumentField(Address))
+
+    meta = {"allow_inheritance": True}
+
+
+class HeadOffice(Office):
+    phone = fields.StringField()
+
+
 def test_id_field_uses_custom_class():
     f = City._meta.get_field("id")
     assert isinstance(f, ObjectIdField)
+
+
+def test_labels():
+    opts = City._meta
+    assert opts.app_label == "views"
+    assert opts.label == opts.label_lower == "views.city"
+    assert str(opts.verbose_name_plural) == "Citys"
+
+
+def test_pk_wrapper():
+    pk = City._meta.pk
+    assert pk.attname == "id"
+    assert pk.db_field == "_id"
+    pk.obj.custom = "value"
+    assert pk.custom == "value"
+    del pk.obj.custom
+
+
+def test_get_field():
+    opts = Office._meta
+    assert opts.get_field("city") is Office._fields["city"]
+    assert opts.get_field("_id") is opts.get_field("id")
+    assert opts.get_field("address__street") is Address._fields["street"]
+    assert opts.get_field("address__s") is Address._fields["street"]
+    assert opts.get_field("branches__street") is Address._fields["street"]
+    assert opts.get_field_by_name("city") == (Office._fields["city"], None, True, False)
+    with pytest.raises(FieldDoesNotExist):
+        opts.get_field("city__name")
+
+
+def test_get_fields():
+    assert set(HeadOffice._meta.get_fields()) == set(HeadOffice._fields.values())
+    assert HeadOffice._meta.get_fields(include_parents=False) == (HeadOffice._fields["phone"],)
@@ -0,0 +1,55 @@
+import subprocess
+import sys
+
+import django_mongoengine
+
+
+def imported_modules(code):
+    result = subprocess.run(
+        [sys.executable, "-c", code + "\nimport sys\nprint(' '.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+def test_import_is_lazy():
+    modules = imported_modules("import django_mongoengine")
+    assert "django_mongoengine" in modules
+    assert "mongoengine" not in modules
+
+
+def test_document_import_skips_forms_and_admin():
+    modules = imported_modules("from django_mongoengine import Document, QuerySet")
+    assert "django_mongoengine.document" in modules
+    for module in [
+        "django_mongoengine.forms.documents",
+        "django_mongoengine.forms.fields",
+        "django_mongoengine.forms.widgets",
+        "django_mongoengine.views",
+        "django_mongoengine.mongo_admin",
+    ]:
+        assert module not in modules
+
+
+def test_lazy_attributes():
+    from django_mongoengine.document import Document
+    from django_mongoengine.forms.documents import DocumentForm
+    from django_mongoengine.views.list import ListView
+
+    assert django_mongoengine.Document is Document
+    assert "Document" in dir(django_mongoengine)
+    assert django_mongoengine.forms.DocumentForm is DocumentForm
+    assert django_mongoengine.views.ListView is ListView
+
+
+def test_forms_exports():
+    from django_mongoengine import forms
+
+    namespace = {}
+    exec("from django_mongoengine.forms import *", namespace)
+    assert namespace["DocumentForm"] is forms.DocumentForm
+    assert namespace["documentform_factory"] is forms.documentform_factory
+    assert namespace["patch_document"] is forms.patch_document
+    assert {"DocumentForm", "EmbeddedDocumentForm", "get_declared_fields"} <= set(dir(forms))
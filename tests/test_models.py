@@ -1,3 +1,10 @@
+import pytest
+from mongoengine import signals
+from mongoengine.errors import NotUniqueError
+from pymongo.errors import DuplicateKeyError, WriteError
+
+from django_mongoengine import Document, fields
+
 from .views.models import Artist, City
 
 
@@ -6,10 +13,104 @@ def test_create():
 
 
 def test_get_or_create():
-    Artist.objects.get_or_create(id="1", defaults={"name": "The Doors"})
-    Artist.objects.get_or_create(id="1", defaults={"name": "The Doors"})
+    Artist.drop_collection()
+    artist, created = Artist.objects.get_or_create(id="1", defaults={"name": "The Doors"})
+    assert created
+    artist, created = Artist.objects.get_or_create(id="1", defaults={"name": "The Doors"})
+    assert not created
+    assert artist.name == "The Doors"
+
+
+def test_get_or_create_generated_pk():
+    City.drop_collection()
+    city, created = City.objects.get_or_create(name="Kyiv")
+    assert created
+    assert city.pk is not None
+    assert City.objects.get(name="Kyiv").pk == city.pk
+    assert City.objects.get_or_create(name="Kyiv") == (city, False)
+    assert City.objects.count() == 1
 
 
 def test_update_or_create():
-    Artist.objects.update_or_create(id="1", defaults={"name": "The Doors"})
-    Artist.objects.update_or_create(id="1", defaults={"name": "The Doors"})
+    Artist.drop_collection()
+    artist, created = Artist.objects.update_or_create(id="1", defaults={"name": "The Doors"})
+    assert created
+    artist, created = Artist.objects.update_or_create(id="1", defaults={"name": "The Beatles"})
+    assert not created
+    assert artist.name == "The Beatles"
+    assert Artist.objects.get(id="1").name == "The Beatles"
+
+
+class Member(Document):
+    name = fields.StringField(required=True)
+    code = fields.StringField(unique=True)
+    saves = 0
+
+    def save(self, *args, **kwargs):
+        type(self).saves += 1
+        return super().save(*args, **kwargs)
+
+
+class Code(Document):
+    name = fields.StringField(required=True)
+    code = fields.StringField(unique=True)
+
+
+def test_get_or_create_custom_save():
+    Member.drop_collection()
+    Member.saves = 0
+    member, created = Member.objects.get_or_create(name="Ann")
+    assert created
+    assert Member.objects.update_or_create(name="Ann", defaults={"code": "a"}) == (member, False)
+    assert Member.saves == 2
+    assert Member.objects.get(name="Ann").code == "a"
+
+
+def test_get_or_create_signals():
+    City.drop_collection()
+    saved = []
+
+    def receiver(sender, document, **kwargs):
+        saved.append(document.name)
+
+    signals.post_save.connect(receiver, sender=City)
+    try:
+        City.objects.get_or_create(name="Kyiv")
+        City.objects.update_or_create(name="Kyiv", defaults={"name": "Kiev"})
+    finally:
+        signals.post_save.disconnect(receiver, sender=City)
+    assert saved == ["Kyiv", "Kiev"]
+
+
+def test_get_or_create_duplicate_key(monkeypatch):
+    Code.drop_collection()
+    Code.objects.create(name="Ann", code="a")
+    collection = type(Code._get_collection())
+    find_one_and_update = collection.find_one_and_update
+    errors = []
+
+    def record_errors(*args, **kwargs):
+        try:
+            return find_one_and_update(*args, **kwargs)
+        except DuplicateKeyError as e:
+            errors.append(e)
+            raise
+
+    monkeypatch.setattr(collection, "find_one_and_update", record_errors)
+    # The upsert fails, and so does create() on the save() path.
+    with pytest.raises(NotUniqueError):
+        Code.objects.get_or_create(name="Bob", defaults={"code": "a"})
+    assert len(errors) == 1
+    assert Code.objects.count() == 1
+
+
+def test_get_or_create_write_error(monkeypatch):
+    City.drop_collection()
+
+    def find_one_and_update(*args, **kwargs):
+        raise WriteError("Document failed validation", 121)
+
+    monkeypatch.setattr(type(City._get_collection()), "find_one_and_update", find_one_and_update)
+    city, created = City.objects.get_or_create(name="Kyiv")
+    assert created
+    assert City.objects.get_or_create(name="Kyiv") == (city, False)
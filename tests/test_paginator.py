@@ -0,0 +1,75 @@
+import pytest
+from django.core.cache import cache
+from django.core.paginator import EmptyPage
+
+from django_mongoengine.paginator import Paginator
+
+from .views.models import City
+
+
+def test_count(make_cities):
+    make_cities(12)
+    paginator = Paginator(City.objects.order_by("name"), 5)
+    assert paginator.count == 12
+    assert not paginator.count_is_capped
+    assert not paginator.count_is_estimated
+
+
+def test_count_capped(make_cities):
+    make_cities(12)
+    paginator = Paginator(City.objects.order_by("name"), 5, max_count=10)
+    assert paginator.count == 10
+    assert paginator.count_is_capped
+    assert paginator.num_pages == 2
+
+    paginator = Paginator(City.objects.filter(name__lt="City 05").order_by("name"), 5, max_count=10)
+    assert paginator.count == 5
+    assert not paginator.count_is_capped
+
+
+def test_count_capped_pages(make_cities):
+    make_cities(30)
+    paginator = Paginator(City.objects.order_by("name"), 5, max_count=10)
+    assert paginator.num_pages == 2
+    assert paginator.page(2).has_next()
+
+    page = paginator.page(3)
+    assert [c.name for c in page] == ["City %02i" % i for i in range(10, 15)]
+    assert page.has_next()
+    assert page.next_page_number() == 4
+    page = paginator.page(6)
+    assert [c.name for c in page][-1] == "City 29"
+    assert not page.has_next()
+    with pytest.raises(EmptyPage):
+        paginator.page(7)
+
+
+def test_count_option_reset(make_cities):
+    class CappedPaginator(Paginator):
+        max_count = 10
+
+    make_cities(12)
+    assert CappedPaginator(City.objects.all(), 5).count == 10
+    paginator = CappedPaginator(City.objects.all(), 5, max_count=None)
+    assert paginator.count == 12
+    assert not paginator.count_is_capped
+
+
+def test_count_estimated(make_cities):
+    make_cities(12)
+    paginator = Paginator(City.objects.order_by("name"), 5, estimate_count=True)
+    assert paginator.count == 12
+    assert paginator.count_is_estimated
+
+    paginator = Paginator(City.objects.filter(name="City 01"), 5, estimate_count=True)
+    assert paginator.count == 1
+    assert not paginator.count_is_estimated
+
+
+def test_count_cache(make_cities):
+    cache.clear()
+    make_cities(3)
+    assert Paginator(City.objects.all(), 5, count_cache="default").count == 3
+    City.objects.create(name="City 99")
+    assert Paginator(City.objects.all(), 5, count_cache="default").count == 3
+    assert Paginator(City.objects.all(), 5).count == 4
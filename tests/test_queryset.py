@@ -0,0 +1,149 @@
+import datetime
+
+import pytest
+from django.core.exceptions import FieldError
+
+from django_mongoengine import Document, QuerySetNoCache, fields
+from django_mongoengine.queryset import BulkWriteError
+
+from .views.models import Artist, Author, Book, City
+
+
+class Review(Document):
+    book = fields.ReferenceField(Book)
+    text = fields.StringField()
+
+
+def test_exists(make_cities):
+    make_cities(3)
+    assert City.objects.exists()
+    assert City.objects.filter(name="City 01").exists()
+    assert not City.objects.filter(name="Atlantis").exists()
+    assert not City.objects.none().exists()
+    assert not City.objects.limit(0).exists()
+    assert City.objects.skip(2).exists()
+    assert not City.objects.skip(3).exists()
+
+
+def test_exists_cached(make_cities):
+    make_cities(3)
+    cities = City.objects.all()
+    list(cities)
+    City.drop_collection()
+    assert cities.exists()
+
+
+def test_exists_no_cache(make_cities):
+    make_cities(1)
+    assert isinstance(City.objects.no_cache(), QuerySetNoCache)
+    assert City.objects.no_cache().exists()
+    assert not City.objects.no_cache().filter(name="Atlantis").exists()
+
+
+def test_iterator(make_cities):
+    make_cities(5)
+    cities = City.objects.order_by("name")
+    names = [city.name for city in cities.iterator(chunk_size=2)]
+    assert names == ["City %02i" % i for i in range(5)]
+    assert cities._result_cache is None
+    assert [city.name for city in cities.filter(name="City 03").iterator()] == ["City 03"]
+
+
+def test_bulk_create():
+    City.drop_collection()
+    cities = [City(name="City %02i" % i) for i in range(5)]
+    assert City.objects.bulk_create(cities, batch_size=2) == cities
+    assert all(city.pk is not None for city in cities)
+    assert sorted(City.objects.values_list("pk")) == sorted(city.pk for city in cities)
+
+
+def test_bulk_create_errors():
+    Artist.drop_collection()
+    Artist.objects.create(id="2", name="Existing")
+    artists = [Artist(id=str(i), name="Artist %s" % i) for i in range(5)]
+    with pytest.raises(BulkWriteError) as e:
+        Artist.objects.bulk_create(artists, batch_size=2, ordered=False)
+    assert [number for number, _details in e.value.errors] == [1]
+    assert Artist.objects.count() == 5
+
+
+def test_bulk_update(make_cities):
+    make_cities(5)
+    cities = list(City.objects.order_by("name"))
+    for city in cities[:3]:
+        city.name = city.name.upper()
+    assert City.objects.bulk_update(cities, ["name"], batch_size=2) == 3
+    assert not cities[0]._get_changed_fields()
+    assert list(City.objects.order_by("name").values_list("name")) == [
+        "CITY 00",
+        "CITY 01",
+        "CITY 02",
+        "City 03",
+        "City 04",
+    ]
+    with pytest.raises(ValueError):
+        City.objects.bulk_update(cities, [])
+
+
+@pytest.fixture
+def reviews():
+    for document in (Author, Book, Review):
+        document.drop_collection()
+    authors = [Author.objects.create(name="Author %i" % i, slug="a%i" % i) for i in range(3)]
+    for i in range(4):
+        book = Book.objects.create(
+            name="Book %i" % i,
+            slug="b%i" % i,
+            pages=10,
+            authors=authors[: i % 3 + 1],
+            pubdate=datetime.datetime(2020, 1, 1),
+        )
+        Review.objects.create(book=book, text="Review %i" % i)
+
+
+def test_prefetch_related(reviews):
+    reviews = list(Review.objects.order_by("text").prefetch_related("book"))
+    books = list(Book.objects.order_by("name").prefetch_related("authors"))
+    # Referenced documents were fetched with the results.
+    Book.drop_collection()
+    Author.drop_collection()
+
+    assert [r.book.name for r in reviews] == ["Book 0", "Book 1", "Book 2", "Book 3"]
+    assert [[a.name for a in b.authors] for b in books] == [
+        ["Author 0"],
+        ["Author 0", "Author 1"],
+        ["Author 0", "Author 1", "Author 2"],
+        ["Author 0"],
+    ]
+    assert not books[0]._get_changed_fields()
+
+
+def test_prefetch_related_page(reviews):
+    queryset = Book.objects.prefetch_related("authors")
+    assert queryset._prefetch_related_lookups == ["authors"]
+    assert queryset.prefetch_related(None)._prefetch_related_lookups == []
+    page = list(queryset.order_by("name")[1:3])
+    Author.drop_collection()
+    assert [len(b.authors) for b in page] == [2, 3]
+    assert page[1].authors[2].name == "Author 2"
+
+
+def test_prefetch_related_iterator(reviews):
+    books = list(Book.objects.order_by("name").prefetch_related("authors").iterator(chunk_size=3))
+    Author.drop_collection()
+    assert [len(b.authors) for b in books] == [1, 2, 3, 1]
+    assert books[3].authors[0].name == "Author 0"
+
+
+def test_prefetch_related_invalid():
+    with pytest.raises(FieldError):
+        Book.objects.prefetch_related("name")
+
+
+def test_select_related_max_depth(reviews):
+    # mongoengine's select_related() is left alone.
+    assert len(Review.objects.select_related()) == 4
+    reviews = Review.objects.order_by("text").select_related(2)
+    assert isinstance(reviews, list)
+    Book.drop_collection()
+    assert reviews[0].book.name == "Book 0"
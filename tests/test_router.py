@@ -0,0 +1,51 @@
+from django.test import override_settings
+from mongoengine import connection
+from pymongo import ReadPreference
+
+from django_mongoengine.router import router
+
+from .views.models import City
+
+ALIAS = "router_test"
+
+
+class SecondaryRouter:
+    def read_preference(self, document, **hints):
+        return ReadPreference.SECONDARY_PREFERRED
+
+
+class ReplicaRouter:
+    def db_for_read(self, document, **hints):
+        if document is City:
+            return ALIAS
+
+
+@override_settings(MONGODB_ROUTERS=[SecondaryRouter()])
+def test_read_preference():
+    assert City.objects._read_preference == ReadPreference.SECONDARY_PREFERRED
+    assert City.objects.filter(name="Paris")._read_preference == (
+        ReadPreference.SECONDARY_PREFERRED
+    )
+
+
+def test_no_routers():
+    assert router.routers == []
+    assert City.objects._read_preference is None
+    assert City.objects._db_alias is None
+
+
+@override_settings(MONGODB_ROUTERS=["tests.test_router.ReplicaRouter"])
+def test_db_for_read():
+    connection.register_connection(ALIAS, name="django_mongoengine_test_router")
+    City.drop_collection()
+    City.objects.create(name="Paris")
+
+    assert router.db_for_read(City) == ALIAS
+    assert router.db_for_write(City) == connection.DEFAULT_CONNECTION_NAME
+    assert City.objects._collection.database.name == "django_mongoengine_test_router"
+    assert City.objects.count() == 0
+
+    # Writes go to the document's own alias.
+    assert City.objects.filter(name="Paris").update(set__name="Lyon") == 1
+    assert City.objects.using(connection.DEFAULT_CONNECTION_NAME).get().name == "Lyon"
+    City.drop_collection()
@@ -0,0 +1,213 @@
+from datetime import timedelta
+
+import pytest
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from django_mongoengine import sessions
+from django_mongoengine.sessions import MongoSession, SessionStore
+from django_mongoengine.sessions.cached_db import SessionStore as CachedSessionStore
+
+
+def setup_function():
+    MongoSession.drop_collection()
+    cache.clear()
+
+
+def test_session_store():
+    session = SessionStore()
+    session["foo"] = "bar"
+    session.save()
+    assert session.exists(session.session_key)
+
+    session = SessionStore(session.session_key)
+    assert session["foo"] == "bar"
+    session.delete()
+    assert not session.exists(session.session_key)
+    assert SessionStore(session.session_key).load() == {}
+
+
+def _raw_session(session_key):
+    return MongoSession._get_collection().find_one({"_id": session_key})
+
+
+def test_session_store_save_expiry_only():
+    session = SessionStore()
+    session["foo"] = "bar"
+    session.save()
+    MongoSession._get_collection().update_one({"_id": session.session_key}, {"$set": {"marker": 1}})
+
+    session = SessionStore(session.session_key)
+    assert session["foo"] == "bar"
+    session_data = _raw_session(session.session_key)["session_data"]
+    session.save()
+    raw = _raw_session(session.session_key)
+    assert raw["session_data"] == session_data
+    assert raw["marker"] == 1
+
+    session["foo"] = "baz"
+    session.save()
+    assert SessionStore(session.session_key)["foo"] == "baz"
+
+
+@pytest.mark.parametrize(
+    "binary, encode",
+    [(False, True), (True, True), (False, False)],
+    ids=["string", "binary", "dict"],
+)
+def test_session_store_save_unchanged(monkeypatch, binary, encode):
+    monkeypatch.setattr(sessions, "MONGOENGINE_SESSION_DATA_BINARY", binary)
+    monkeypatch.setattr(sessions, "MONGOENGINE_SESSION_DATA_ENCODE", encode)
+    monkeypatch.setattr(sessions, "MONGOENGINE_SESSION_EXPIRY_GRANULARITY", 60)
+    session = SessionStore()
+    session["cart"] = [1]
+    session.save()
+    session = SessionStore(session.session_key)
+    assert session["cart"] == [1]
+    stale = _raw_session(session.session_key)["expire_date"] - timedelta(days=1)
+    MongoSession._get_collection().update_one(
+        {"_id": session.session_key}, {"$set": {"expire_date": stale}}
+    )
+    session.save()
+    assert _raw_session(session.session_key)["expire_date"] == stale
+
+    # Changes are noticed without session.modified being set.
+    session["cart"].append(2)
+    session.save()
+    assert _raw_session(session.session_key)["expire_date"] > stale
+    assert SessionStore(session.session_key)["cart"] == [1, 2]
+
+
+def test_session_store_save_granularity(monkeypatch):
+    monkeypatch.setattr(sessions, "MONGOENGINE_SESSION_EXPIRY_GRANULARITY", 60)
+    session = SessionStore()
+    session["foo"] = "bar"
+    session.save()
+    session = SessionStore(session.session_key)
+    assert session["foo"] == "bar"
+    # Tell writes apart from skipped ones.
+    stale = _raw_session(session.session_key)["expire_date"] - timedelta(days=1)
+    MongoSession._get_collection().update_one(
+        {"_id": session.session_key}, {"$set": {"expire_date": stale}}
+    )
+    session.save()
+    assert _raw_session(session.session_key)["expire_date"] == stale
+
+    monkeypatch.setattr(sessions, "MONGOENGINE_SESSION_EXPIRY_GRANULARITY", 0)
+    session.save()
+    assert _raw_session(session.session_key)["expire_date"] > stale
+
+
+def test_cached_session_store():
+    session = CachedSessionStore()
+    session["foo"] = "bar"
+    session.save()
+    assert cache.get(session.cache_key)[0] == {"foo": "bar"}
+
+    # Reads are served by the cache.
+    MongoSession.objects.update(set__session_data="")
+    assert CachedSessionStore(session.session_key)["foo"] == "bar"
+
+    # ... and fall back to MongoDB.
+    cache.clear()
+    session["foo"] = "baz"
+    session.save()
+    cache.clear()
+    assert CachedSessionStore(session.session_key)["foo"] == "baz"
+    assert cache.get(session.cache_key)[0] == {"foo": "baz"}
+
+
+def test_cached_session_store_save_skipped(monkeypatch):
+    monkeypatch.setattr(sessions, "MONGOENGINE_SESSION_EXPIRY_GRANULARITY", 60)
+    session = CachedSessionStore()
+    session["foo"] = "bar"
+    session.save()
+    # Tell writes apart from skipped ones.
+    stale = _raw_session(session.session_key)["expire_date"] - timedelta(days=1)
+    MongoSession._get_collection().update_one(
+        {"_id": session.session_key}, {"$set": {"expire_date": stale}}
+    )
+
+    # The session is read from the cache, and not written again.
+    session = CachedSessionStore(session.session_key)
+    assert session["foo"] == "bar"
+    session.save()
+    assert _raw_session(session.session_key)["expire_date"] == stale
+
+    session["foo"] = "baz"
+    session.save()
+    assert _raw_session(session.session_key)["expire_date"] > stale
+    assert CachedSessionStore(session.session_key)["foo"] == "baz"
+
+
+def test_cached_session_store_cycle_key():
+    session = CachedSessionStore()
+    session["foo"] = "bar"
+    session.save()
+    old_key = session.session_key
+    session.cycle_key()
+
+    assert cache.get(CachedSessionStore.cache_key_prefix + old_key) is None
+    assert not session.exists(old_key)
+    assert CachedSessionStore(session.session_key)["foo"] == "bar"
+
+    session.flush()
+    assert not session.exists(session.session_key or old_key)
+    assert not MongoSession.objects.count()
+
+
+def test_session_store_binary(monkeypatch):
+    monkeypatch.setattr(sessions, "MONGOENGINE_SESSION_DATA_BINARY", True)
+    monkeypatch.setattr(sessions, "MONGOENGINE_SESSION_DATA_COMPRESS_MIN_SIZE", 100)
+    session = SessionStore()
+    session["small"] = "x"
+    session.save()
+    small = _raw_session(session.session_key)["session_data"]
+    assert isinstance(small, bytes)
+    assert SessionStore(session.session_key)["small"] == "x"
+
+    session["cart"] = ["item"] * 100
+    session.save()
+    large = _raw_session(session.session_key)["session_data"]
+    assert len(large) < len(session.serializer().dumps(session._session))
+    assert SessionStore(session.session_key)["cart"] == ["item"] * 100
+
+    tampered = large[:-1] + bytes([large[-1] ^ 1])
+    assert session.decode_binary(tampered) == {}
+
+
+def test_clear_expired(monkeypatch):
+    monkeypatch.setattr(sessions, "MONGOENGINE_SESSION_CLEAR_BATCH_SIZE", 2)
+    monkeypatch.setattr(sessions, "MONGOENGINE_SESSION_CLEAR_SLEEP", 0.5)
+    sleeps = []
+    monkeypatch.setattr(sessions.time, "sleep", sleeps.append)
+    now = timezone.now()
+    for i in range(5):
+        MongoSession(session_key="expired%s" % i, expire_date=now - timedelta(days=i + 1)).save()
+    MongoSession(session_key="valid", expire_date=now + timedelta(days=1)).save()
+
+    SessionStore.clear_expired()
+    assert [s.session_key for s in MongoSession.objects] == ["valid"]
+    assert sleeps == [0.5, 0.5]
+
+
+def test_session_store_binary_reads_string_sessions(monkeypatch):
+    session = SessionStore()
+    session["foo"] = "bar"
+    session.save()
+    assert isinstance(_raw_session(session.session_key)["session_data"], str)
+
+    monkeypatch.setattr(sessions, "MONGOENGINE_SESSION_DATA_BINARY", True)
+    assert SessionStore(session.session_key).load() == {}
+
+
+def test_session_store_string_reads_binary_sessions(monkeypatch):
+    monkeypatch.setattr(sessions, "MONGOENGINE_SESSION_DATA_BINARY", True)
+    session = SessionStore()
+    session["foo"] = "bar"
+    session.save()
+    assert isinstance(_raw_session(session.session_key)["session_data"], bytes)
+
+    monkeypatch.setattr(sessions, "MONGOENGINE_SESSION_DATA_BINARY", False)
+    assert SessionStore(session.session_key).load() == {}
@@ -2,7 +2,7 @@ import importlib
 
 from mongoengine.queryset import QuerySet
 
-from django_mongoengine.utils.monkey import get_patched_django_module
+from django_mongoengine.utils.monkey import get_patched_django_class, get_patched_django_module
 
 
 def test_monkey_patch():
@@ -13,3 +13,13 @@ def test_monkey_patch():
     original = importlib.import_module("django.views.generic.list")
 
     assert original.QuerySet is not QuerySet
+
+
+def test_patched_class():
+    original = importlib.import_module("django.views.generic.list")
+    patched = get_patched_django_class(original.MultipleObjectMixin, QuerySet=QuerySet)
+
+    assert issubclass(patched, original.MultipleObjectMixin)
+    assert patched.get_queryset.__globals__["QuerySet"] is QuerySet
+    assert patched.get_ordering is original.MultipleObjectMixin.get_ordering
+    assert original.QuerySet is not QuerySet
@@ -1,8 +1,11 @@
 #!/usr/bin/env python
 
 from django.core.exceptions import ImproperlyConfigured
+from django.test import RequestFactory
 
-from .models import Artist, Author
+from django_mongoengine.views import ListView
+
+from .models import Artist, Author, Book
 from .tests import TestCase
 
 
@@ -86,6 +89,35 @@ class ListViewTests(TestCase):
         res = self.client.get("/list/authors/paginated/?page=frog")
         self.assertEqual(res.status_code, 404)
 
+    def test_keyset_paginated_queryset(self):
+        self._make_authors(100)
+        res = self.client.get("/list/authors/keyset/")
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(len(res.context["object_list"]), 30)
+        self.assertTrue(res.context["is_paginated"])
+        page = res.context["page_obj"]
+        self.assertFalse(page.has_previous())
+        self.assertEqual(res.context["author_list"][0].name, "Author 00")
+
+        for first in ("Author 30", "Author 60", "Author 90"):
+            res = self.client.get("/list/authors/keyset/", {"page": page.next_page_number()})
+            self.assertEqual(res.status_code, 200)
+            page = res.context["page_obj"]
+            self.assertEqual(res.context["author_list"][0].name, first)
+        self.assertEqual(len(res.context["object_list"]), 10)
+        self.assertFalse(page.has_next())
+
+        res = self.client.get("/list/authors/keyset/", {"page": page.previous_page_number()})
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.context["author_list"][0].name, "Author 60")
+        self.assertEqual(list(res.context["author_list"])[-1].name, "Author 89")
+        self.assertTrue(res.context["page_obj"].has_next())
+
+    def test_keyset_paginated_invalid_cursor(self):
+        self._make_authors(100)
+        res = self.client.get("/list/authors/keyset/?page=frog")
+        self.assertEqual(res.status_code, 404)
+
     def test_paginated_custom_paginator_class(self):
         self._make_authors(7)
         res = self.client.get("/list/authors/paginated/custom_class/")
@@ -156,6 +188,15 @@ class ListViewTests(TestCase):
     def test_missing_items(self):
         self.assertRaises(ImproperlyConfigured, self.client.get, "/list/authors/invalid/")
 
+    def test_list_select_related(self):
+        view = ListView(model=Book)
+        view.setup(RequestFactory().get("/"))
+        self.assertEqual(view.get_queryset()._prefetch_related_lookups, [])
+        view.list_select_related = True
+        self.assertEqual(view.get_queryset()._prefetch_related_lookups, ["authors"])
+        view.list_select_related = ["authors"]
+        self.assertEqual(view.get_queryset()._prefetch_related_lookups, ["authors"])
+
     def _make_authors(self, n):
         Author.objects.all().delete()
         for i in range(n):
@@ -2,6 +2,8 @@ from django.urls import re_path as url
 from django.views.decorators.cache import cache_page
 from django.views.generic import TemplateView
 
+from django_mongoengine.paginator import KeysetPaginator
+
 from . import views
 
 urlpatterns = [
@@ -87,6 +89,10 @@ urlpatterns = [
     url(r"^list/authors/$", views.AuthorList.as_view(), name="authors_list"),
     url(r"^list/authors/paginated/$", views.AuthorList.as_view(paginate_by=30)),
     url(r"^list/authors/paginated/(?P<page>\d+)/$", views.AuthorList.as_view(paginate_by=30)),
+    url(
+        r"^list/authors/keyset/$",
+        views.AuthorList.as_view(paginate_by=30, paginator_class=KeysetPaginator),
+    ),
     url(r"^list/authors/notempty/$", views.AuthorList.as_view(allow_empty=False)),
     url(
         r"^list/authors/template_name/$", views.AuthorList.as_view(template_name="views/list.html")